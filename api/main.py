@@ -8,14 +8,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 import uvicorn
+import copy
+import hashlib
 import logging
 import json
-import os
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder
+    orjson = None
+
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 sys.path.append(str(Path(__file__).parent.parent / "config"))
@@ -25,9 +32,24 @@ from performance_monitor import PerformanceMonitor, check_system_resources
 import settings
 
 # Import centralized logging
-from utils import setup_logging
+from utils import setup_logging, label_enums
 logger = logging.getLogger(__name__)
 
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed"""
+    
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # Types orjson cannot encode fall through to the standard encoder, as in write_json
+            return super().render(content)
+
+# Single-resume analyses kept in memory, keyed by upload content and job fields
+ANALYSIS_CACHE_SIZE = 1024
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
@@ -59,6 +81,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
     lifespan=lifespan
 )
 
@@ -74,6 +97,28 @@ app.add_middleware(
 # Initialize components
 screener = ResumeScreener()
 performance_monitor = PerformanceMonitor()
+_analysis_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+def _analysis_cache_key(content: bytes, file_extension: str, job_title: str,
+                        job_description: str, requirements: str) -> tuple:
+    """Build the analysis cache key from a compact hash of the uploaded file"""
+    content_hash = hashlib.blake2b(content, digest_size=16).digest()
+    return (content_hash, file_extension, job_title, job_description, requirements)
+
+def _cached_analysis(key: tuple) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached analysis result, or None on a miss"""
+    result = _analysis_cache.get(key)
+    if result is None:
+        return None
+    _analysis_cache.move_to_end(key)
+    return copy.deepcopy(result)
+
+def _cache_analysis(key: tuple, result: Dict[str, Any]):
+    """Store a copy of an analysis result, evicting the least recently used entry if full"""
+    _analysis_cache[key] = copy.deepcopy(result)
+    _analysis_cache.move_to_end(key)
+    if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+        _analysis_cache.popitem(last=False)
 
 # Pydantic models for request/response
 class JobDescription(BaseModel):
@@ -145,7 +190,7 @@ async def get_performance_metrics():
     """Get performance metrics"""
     try:
         summary = performance_monitor.get_summary()
-        recent_metrics = performance_monitor.metrics[-10:] if performance_monitor.metrics else []
+        recent_metrics = performance_monitor.get_metrics(last=10)
         system_health = check_system_resources()
         
         return PerformanceMetricsResponse(
@@ -184,41 +229,43 @@ async def analyze_resume(
                 detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
             )
         
+        content = await file.read()
+        
+        # Identical uploads against the same job reuse the stored analysis
+        cache_key = _analysis_cache_key(content, file_extension, job_title, job_description, requirements)
+        
         # Save uploaded file temporarily
         temp_file_path = f"temp_{file.filename}"
-        with open(temp_file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
         
         try:
             # Start performance monitoring
             performance_monitor.start_monitoring()
             
-            # Create job description object
-            job_desc = JobDescription(
-                title=job_title,
-                description=job_description,
-                requirements=requirements.split(',') if requirements else []
-            )
-            
-            # Create a temporary job description file
-            job_desc_file = f"temp_job_{file.filename}.txt"
-            with open(job_desc_file, 'w') as f:
-                f.write(f"Job Title: {job_title}\n")
-                f.write(f"Job Description: {job_description}\n")
-                f.write(f"Requirements: {requirements}\n")
-            
-            try:
-                # Analyze resume
-                result = screener.analyze_single_resume(
-                    resume_path=temp_file_path,
-                    job_path=job_desc_file,
-                    output_file=None
-                )
-            finally:
-                # Cleanup job description file
-                if os.path.exists(job_desc_file):
-                    os.remove(job_desc_file)
+            result = _cached_analysis(cache_key)
+            if result is None:
+                with open(temp_file_path, "wb") as buffer:
+                    buffer.write(content)
+                
+                # Create a temporary job description file
+                job_desc_file = f"temp_job_{file.filename}.txt"
+                with open(job_desc_file, 'w') as f:
+                    f.write(f"Job Title: {job_title}\n")
+                    f.write(f"Job Description: {job_description}\n")
+                    f.write(f"Requirements: {requirements}\n")
+                
+                try:
+                    # Analyze resume
+                    result = screener.analyze_single_resume(
+                        resume_path=temp_file_path,
+                        job_path=job_desc_file,
+                        output_file=None
+                    )
+                finally:
+                    # Cleanup job description file
+                    Path(job_desc_file).unlink(missing_ok=True)
+                
+                if result:
+                    _cache_analysis(cache_key, result)
             
             # Calculate processing time
             processing_time = performance_monitor.get_memory_usage().get('current_mb', 0)
@@ -240,7 +287,7 @@ async def analyze_resume(
             # Format response
             response = ResumeAnalysisResponse(
                 overall_score=result.get('overall_score', 0),
-                breakdown=result.get('breakdown', {}),
+                breakdown=label_enums(result.get('breakdown', {})),
                 skills_found=result.get('skills_found', {}),
                 recommendations=result.get('ats_analysis', {}).get('recommendations', []),
                 processing_time=processing_time,
@@ -251,8 +298,7 @@ async def analyze_resume(
             
         finally:
             # Cleanup temporary file
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
+            Path(temp_file_path).unlink(missing_ok=True)
             performance_monitor.stop_monitoring()
             
     except HTTPException:
@@ -360,14 +406,12 @@ async def batch_analysis(
                 }
             finally:
                 # Cleanup job description file
-                if os.path.exists(job_desc_file):
-                    os.remove(job_desc_file)
+                Path(job_desc_file).unlink(missing_ok=True)
             
         finally:
             # Cleanup temporary files
             for temp_file in temp_files:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
+                Path(temp_file).unlink(missing_ok=True)
             performance_monitor.stop_monitoring()
             
     except HTTPException:
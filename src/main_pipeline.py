@@ -56,7 +56,7 @@ class ResumeScreener:
             Dictionary containing analysis results
         """
         try:
-            self.logger.info(f"Starting analysis of: {resume_path}")
+            self.logger.info("Starting analysis of: %s", resume_path)
             start_time = time.time()
             
             # Parse resume
@@ -69,10 +69,10 @@ class ResumeScreener:
             processed_data = self.preprocessor.preprocess_text(raw_text)
             processed_text = processed_data.get('cleaned_text', raw_text)
             
-            # Extract skills
+            # Extract skills (one pass yields both categories)
             skills = self.skills_extractor.extract_skills(processed_text)
-            technical_skills = self.skills_extractor.extract_technical_skills(processed_text)
-            soft_skills = self.skills_extractor.extract_soft_skills(processed_text)
+            technical_skills = skills['technical_skills']
+            soft_skills = skills['soft_skills']
             
             # Comprehensive resume analysis
             full_analysis = self.resume_analyzer.analyze_full_resume(raw_text)
@@ -107,7 +107,7 @@ class ResumeScreener:
                 'metrics': full_analysis.get('metrics', {})
             }
             
-            self.logger.info(f"Analysis completed in {processing_time:.2f}s")
+            self.logger.info("Analysis completed in %.2fs", processing_time)
             return results
             
         except Exception as e:
@@ -157,7 +157,7 @@ class ResumeScreener:
             Dictionary containing match results
         """
         try:
-            self.logger.info(f"Matching resume {resume_path} to job description")
+            self.logger.info("Matching resume %s to job description", resume_path)
             start_time = time.time()
             
             # Analyze resume
@@ -204,7 +204,7 @@ class ResumeScreener:
                 'sections': resume_analysis.get('sections', {})
             }
             
-            self.logger.info(f"Match completed in {processing_time:.2f}s")
+            self.logger.info("Match completed in %.2fs", processing_time)
             return results
             
         except Exception as e:
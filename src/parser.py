@@ -10,6 +10,9 @@ import logging
 from utils import setup_logging
 logger = logging.getLogger(__name__)
 
+# Encodings tried in order when decoding TXT resumes
+TXT_ENCODINGS = ('utf-8', 'utf-16', 'latin-1', 'cp1252')
+
 
 class ResumeParser:
     """Parser for extracting text from resume files (PDF and DOCX)"""
@@ -102,7 +105,7 @@ class ResumeParser:
                 logger.error(f"No text could be extracted from PDF: {file_path}")
                 return None
             
-            logger.info(f"Successfully parsed PDF: {file_path} ({len(text)} characters)")
+            logger.info("Successfully parsed PDF: %s (%d characters)", file_path, len(text))
             return text.strip()
             
         except ImportError:
@@ -151,7 +154,7 @@ class ResumeParser:
                 logger.error(f"No text could be extracted from DOCX: {file_path}")
                 return None
             
-            logger.info(f"Successfully parsed DOCX: {file_path} ({len(text)} characters)")
+            logger.info("Successfully parsed DOCX: %s (%d characters)", file_path, len(text))
             return text.strip()
             
         except ImportError:
@@ -176,33 +179,15 @@ class ResumeParser:
     def _parse_txt(self, file_path: str) -> str:
         """Parse TXT file and extract text with enhanced error handling"""
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
-            text = None
-            
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        text = file.read()
-                    logger.debug(f"Successfully read {file_path} with {encoding} encoding")
-                    break
-                except UnicodeDecodeError:
-                    logger.debug(f"Failed to read {file_path} with {encoding} encoding")
-                    continue
-                except Exception as e:
-                    logger.debug(f"Error reading {file_path} with {encoding} encoding: {str(e)}")
-                    continue
-            
+            with open(file_path, 'rb') as file:
+                data = file.read()
+            text = self.extract_text_from_bytes(data)
             if text is None:
-                logger.error(f"Could not read {file_path} with any supported encoding")
+                logger.error(f"Could not extract text from TXT: {file_path}")
                 return None
             
-            if not text.strip():
-                logger.error(f"TXT file is empty or contains only whitespace: {file_path}")
-                return None
-            
-            logger.info(f"Successfully parsed TXT: {file_path} ({len(text)} characters)")
-            return text.strip()
+            logger.info("Successfully parsed TXT: %s (%d characters)", file_path, len(text))
+            return text
             
         except Exception as e:
             logger.error(f"Error parsing TXT {file_path}: {str(e)}")
@@ -213,6 +198,32 @@ class ResumeParser:
         """Extract text from TXT file (alias for _parse_txt)"""
         return self._parse_txt(file_path)
     
+    def extract_text_from_bytes(self, data: bytes, encoding: str = 'utf-8') -> str:
+        """Decode TXT resume content, trying the given encoding before the fallbacks"""
+        text = None
+        
+        for candidate in dict.fromkeys((encoding,) + TXT_ENCODINGS):
+            try:
+                text = data.decode(candidate)
+                logger.debug("Successfully decoded text with %s encoding", candidate)
+                break
+            except (UnicodeDecodeError, LookupError):
+                logger.debug("Failed to decode text with %s encoding", candidate)
+                continue
+        
+        if text is None:
+            logger.error("Could not decode text with any supported encoding")
+            return None
+        
+        # Match text-mode file reads, which translate universal newlines
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+        
+        if not text.strip():
+            logger.error("TXT content is empty or contains only whitespace")
+            return None
+        
+        return text.strip()
+    
     def parse_multiple_resumes(self, directory_path: str):
         """Parse multiple resume files from a directory"""
         parsed_resumes = []
@@ -232,7 +243,7 @@ class ResumeParser:
                     if parsed_resume:
                         parsed_resumes.append(parsed_resume)
         
-        logger.info(f"Successfully parsed {len(parsed_resumes)} resume files")
+        logger.info("Successfully parsed %d resume files", len(parsed_resumes))
         return parsed_resumes
 
 
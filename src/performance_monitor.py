@@ -7,30 +7,45 @@ import time
 import psutil
 import logging
 import json
+from collections import Counter
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime
 from functools import wraps
 import tracemalloc
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Initial capacity of the duration buffer; grows by doubling when full
+DURATION_BUFFER_SIZE = 1024
+
 class PerformanceMonitor:
     """Monitor system performance and resource usage"""
     
-    def __init__(self, output_dir: str = "logs"):
+    def __init__(self, output_dir: str = "logs", *, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.metrics = []
+        # Metrics are stored column-wise, the only copy of each field;
+        # get_summary reads durations and operation names directly
+        self._durations = np.empty(DURATION_BUFFER_SIZE, dtype=np.float64)
+        self._operations = []
+        # (timestamp, system_metrics, memory_usage, additional_data) per metric
+        self._details = []
         self.start_time = None
         self.tracemalloc_start = None
         
     def start_monitoring(self):
         """Start performance monitoring"""
-        self.start_time = time.time()
+        self.start_time = self._clock()
         self.tracemalloc_start = tracemalloc.start()
         logger.info("Performance monitoring started")
         
+    def elapsed(self) -> float:
+        """Seconds since start_monitoring, measured with the monitor's clock"""
+        return self._clock() - self.start_time
+    
     def stop_monitoring(self):
         """Stop performance monitoring"""
         if self.tracemalloc_start:
@@ -77,18 +92,50 @@ class PerformanceMonitor:
                      memory_usage: Optional[Dict] = None, 
                      additional_data: Optional[Dict] = None):
         """Record a performance metric"""
-        metric = {
-            'timestamp': datetime.now().isoformat(),
-            'operation': operation,
-            'duration_seconds': duration,
-            'system_metrics': self.get_system_metrics(),
-            'memory_usage': memory_usage or self.get_memory_usage(),
-            'additional_data': additional_data or {}
-        }
-        
-        self.metrics.append(metric)
+        self._details.append((
+            datetime.now().isoformat(),
+            self.get_system_metrics(),
+            memory_usage or self.get_memory_usage(),
+            additional_data or {}
+        ))
+        self._append_duration(duration)
+        self._operations.append(operation)
         logger.info(f"Performance metric recorded: {operation} took {duration:.2f}s")
         
+    def _append_duration(self, duration: float):
+        """Append a duration to the buffer, doubling its capacity when full"""
+        count = len(self._operations)
+        if count == len(self._durations):
+            grown = np.empty(2 * count, dtype=np.float64)
+            grown[:count] = self._durations
+            self._durations = grown
+        self._durations[count] = duration
+    
+    @property
+    def metrics(self) -> List[Dict[str, Any]]:
+        """All recorded metrics, oldest first"""
+        return self.get_metrics()
+    
+    def get_metrics(self, last: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Build metric records from the column buffers
+        
+        Args:
+            last: Only return the most recent ``last`` metrics
+        """
+        start = max(len(self._operations) - last, 0) if last is not None else 0
+        return [
+            {
+                'timestamp': timestamp,
+                'operation': self._operations[i],
+                'duration_seconds': float(self._durations[i]),
+                'system_metrics': system_metrics,
+                'memory_usage': memory_usage,
+                'additional_data': additional_data
+            }
+            for i, (timestamp, system_metrics, memory_usage, additional_data)
+            in enumerate(self._details[start:], start)
+        ]
+    
     def save_metrics(self, filename: str = None):
         """Save metrics to file"""
         if not filename:
@@ -111,20 +158,20 @@ class PerformanceMonitor:
     
     def get_summary(self) -> Dict[str, Any]:
         """Get performance summary"""
-        if not self.metrics:
+        if not self._operations:
             return {}
         
-        durations = [m['duration_seconds'] for m in self.metrics]
-        operations = [m['operation'] for m in self.metrics]
+        durations = self._durations[:len(self._operations)]
+        operation_counts = Counter(self._operations)
         
         return {
-            'total_operations': len(self.metrics),
-            'total_duration': sum(durations),
-            'average_duration': sum(durations) / len(durations),
-            'min_duration': min(durations),
-            'max_duration': max(durations),
-            'unique_operations': list(set(operations)),
-            'operation_counts': {op: operations.count(op) for op in set(operations)}
+            'total_operations': len(self._operations),
+            'total_duration': float(durations.sum()),
+            'average_duration': float(durations.mean()),
+            'min_duration': float(durations.min()),
+            'max_duration': float(durations.max()),
+            'unique_operations': list(operation_counts),
+            'operation_counts': dict(operation_counts)
         }
     
     def print_summary(self):
@@ -157,7 +204,7 @@ def monitor_performance(operation_name: str = None):
             
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - monitor.start_time
+                duration = monitor.elapsed()
                 
                 monitor.record_metric(
                     operation=operation_name or func.__name__,
@@ -167,7 +214,7 @@ def monitor_performance(operation_name: str = None):
                 
                 return result
             except Exception as e:
-                duration = time.time() - monitor.start_time
+                duration = monitor.elapsed()
                 monitor.record_metric(
                     operation=operation_name or func.__name__,
                     duration=duration,
@@ -31,7 +31,7 @@ class TextPreprocessor:
         # Remove leading/trailing whitespace
         text = text.strip()
         
-        logger.info(f"Cleaned text, length: {len(text)} characters")
+        logger.info("Cleaned text, length: %d characters", len(text))
         return text
     
     def preprocess_text(self, text: str):
@@ -86,7 +86,7 @@ class ResumeAnalyzer:
             'metrics': self._calculate_metrics(text)
         }
         
-        logger.info(f"Comprehensive analysis completed: {len(text)} characters, {analysis['word_count']} words")
+        logger.info("Comprehensive analysis completed: %d characters, %s words", len(text), analysis['word_count'])
         return analysis
     
     def _extract_sections(self, text: str) -> Dict[str, str]:
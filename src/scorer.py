@@ -3,16 +3,112 @@ Advanced ATS Resume Scorer Module
 Provides comprehensive ATS-style analysis with detailed breakdowns, recommendations, and insights
 """
 
+import copy
+import functools
+import hashlib
+import heapq
 import logging
-from typing import Dict, List, Any, Set
+import operator
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from typing import Callable, Dict, List, Any, Set, Optional, Tuple
 import re
 from datetime import datetime
-import fuzzywuzzy.fuzz as fuzz
+import numpy as np
 
 # Import centralized logging
-from utils import setup_logging
+from utils import build_keyword_automaton, iter_keyword_matches
 logger = logging.getLogger(__name__)
 
+# Sentence embedding model used for semantic similarity
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+EMBEDDING_BATCH_SIZE = 64
+
+# Weight of semantic similarity when blended with the ATS score in rankings
+SEMANTIC_WEIGHT = 0.3
+
+# LRU cache sizes for embeddings and ATS score results
+EMBEDDING_CACHE_SIZE = 4096
+SCORE_CACHE_SIZE = 1024
+
+
+class MatchStatus(IntEnum):
+    """Match status of a requirement, rendered with an emoji label for display"""
+    NO = 0
+    PARTIAL = 1
+    YES = 2
+    
+    @property
+    def label(self) -> str:
+        """Display label for the UI and reports"""
+        return _STATUS_LABELS[self]
+    
+    def __str__(self) -> str:
+        return self.label
+
+
+_STATUS_LABELS = {
+    MatchStatus.NO: "❌ No",
+    MatchStatus.PARTIAL: "⚠️ Partial",
+    MatchStatus.YES: "✅ Yes"
+}
+
+
+# Keywords that evidence each specific job requirement
+SPECIFIC_REQUIREMENT_VOCAB = {
+    'ios_development': ('swift', 'swiftui', 'uikit', 'cocoa touch', 'ios'),
+    'swift_experience': ('swift', 'swiftui'),
+    'team_collaboration': ('agile', 'scrum', 'collaboration', 'team'),
+    'accessibility': ('accessibility', 'voiceover', 'wcag', 'dynamic type'),
+    'testing': ('xctest', 'xcuitest', 'testing', 'tdd', 'unit testing'),
+    'cicd': ('jenkins', 'fastlane', 'github actions', 'ci/cd', 'bitrise'),
+    'authentication': ('oauth', 'oauth 2.0', 'authentication', 'jwt'),
+    'app_store': ('app store connect', 'testflight', 'app store')
+}
+
+
+def _build_requirement_automaton():
+    """Build one automaton mapping every requirement keyword to its categories"""
+    keyword_categories = {}
+    for category, keywords in SPECIFIC_REQUIREMENT_VOCAB.items():
+        for keyword in keywords:
+            keyword_categories.setdefault(keyword, []).append(category)
+    return build_keyword_automaton(
+        {keyword: tuple(categories) for keyword, categories in keyword_categories.items()}
+    )
+
+
+# Built once at import; scans a resume for all requirement keywords in one pass
+_REQUIREMENT_AUTOMATON = _build_requirement_automaton()
+
+
+@functools.lru_cache(maxsize=None)
+def _fuzz():
+    """Import rapidfuzz's scorers on first use"""
+    from rapidfuzz import fuzz
+    return fuzz
+
+
+def _content_hash(text: str) -> bytes:
+    """Return a compact content hash used as a cache key"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def _analysis_hash(resume_text: str, resume_skills: Dict[str, Any],
+                   resume_analysis: Dict[str, Any]) -> bytes:
+    """Hash the resume text together with every extracted field the ATS score reads"""
+    skills_found = resume_analysis.get('skills_found', {})
+    inputs = (
+        sorted(resume_skills.get('technical_skills', [])),
+        sorted(resume_skills.get('soft_skills', [])),
+        sorted(skills_found.get('technical_skills', [])),
+        resume_analysis.get('experience', []),
+        resume_analysis.get('education', [])
+    )
+    return _content_hash(resume_text + '\0' + repr(inputs))
+
 
 class ResumeScorer:
     """Advanced ATS Resume Scorer with detailed analysis"""
@@ -20,28 +116,84 @@ class ResumeScorer:
     def __init__(self, use_semantic_similarity: bool = True):
         """Initialize the resume scorer"""
         self.use_semantic_similarity = use_semantic_similarity
+        self._embedder = None
+        
+        # LRU caches keyed by content hash: resumes are re-scored against
+        # many jobs and job descriptions are compared against many resumes
+        self._emb_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._score_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
         logger.info("Advanced ATS Resume Scorer initialized")
     
     def calculate_ats_score(self, resume_analysis: Dict[str, Any], 
                           job_requirements: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate comprehensive ATS match score with detailed breakdown"""
+        return self.make_scorer(job_requirements)(resume_analysis)
+    
+    def make_scorer(self, job_requirements: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Create an ATS scoring function specialized for one set of job requirements
+        
+        Normalized requirement sets, their reciprocal sizes and the cache key are
+        computed once here instead of once per resume, which matters when the
+        same job is scored against a large batch of resumes.
+        """
+        required_skills = frozenset(skill.lower() for skill in job_requirements.get('required_skills', []))
+        preferred_skills = frozenset(skill.lower() for skill in job_requirements.get('preferred_skills', []))
+        required_years = job_requirements.get('experience_years', 0)
         
-        # Extract key data
+        job_profile = {
+            'required_skills': required_skills,
+            'preferred_skills': preferred_skills,
+            'inv_required': 1.0 / len(required_skills) if required_skills else 0.0,
+            'inv_preferred': 1.0 / len(preferred_skills) if preferred_skills else 0.0,
+            'required_years': required_years
+        }
+        job_key = (required_skills, preferred_skills, required_years)
+        
+        def score(resume_analysis: Dict[str, Any]) -> Dict[str, Any]:
+            return self._score_resume(resume_analysis, job_requirements, job_profile, job_key)
+        
+        return score
+    
+    def _score_resume(self, resume_analysis: Dict[str, Any], job_requirements: Dict[str, Any],
+                      job_profile: Dict[str, Any], job_key: Tuple) -> Dict[str, Any]:
+        """Score one resume against prepared job requirements"""
+        
+        resume_text = resume_analysis.get('text')
         resume_skills = resume_analysis.get('skills', resume_analysis.get('skills_found', {}))
+        
+        # Results are cached per (resume inputs, job requirements) pair; callers
+        # get their own copy so mutating a result never changes later hits
+        cache_key = None
+        if resume_text:
+            cache_key = (_analysis_hash(resume_text, resume_skills, resume_analysis), job_key)
+            cached = self._cache_get(self._score_cache, cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+        
+        # Extract key data
         technical_skills = set(resume_skills.get('technical_skills', []))
         soft_skills = set(resume_skills.get('soft_skills', []))
+        
+        # Normalize case once; every downstream comparison is case-insensitive
+        technical_lower = frozenset(skill.lower() for skill in technical_skills)
+        soft_lower = frozenset(skill.lower() for skill in soft_skills)
         experience_entries = resume_analysis.get('experience', [])
         education_entries = resume_analysis.get('education', [])
         
         # Debug logging
-        logger.info(f"Technical skills found: {len(technical_skills)}")
-        logger.info(f"Soft skills found: {len(soft_skills)}")
-        logger.info(f"Experience entries: {len(experience_entries)}")
+        logger.info("Technical skills found: %d", len(technical_skills))
+        logger.info("Soft skills found: %d", len(soft_skills))
+        logger.info("Experience entries: %d", len(experience_entries))
+        
+        # Requirement keywords found directly in the resume text
+        text_hits = self._check_specific_requirements_text(resume_text.lower()) if resume_text else frozenset()
         
         # Calculate detailed breakdown
         breakdown = self._calculate_detailed_breakdown(
-            technical_skills, soft_skills, experience_entries, 
-            education_entries, job_requirements
+            technical_lower, soft_lower, experience_entries, 
+            education_entries, job_profile, text_hits
         )
         
         # Calculate overall score
@@ -57,32 +209,57 @@ class ResumeScorer:
             'detailed_matches': self._create_detailed_matches(breakdown, job_requirements)
         }
         
+        if cache_key is not None:
+            self._cache_put(self._score_cache, cache_key, copy.deepcopy(analysis), SCORE_CACHE_SIZE)
+        
         return analysis
     
-    def _calculate_detailed_breakdown(self, technical_skills: Set[str], 
-                                    soft_skills: Set[str],
+    def _cache_get(self, cache: OrderedDict, key):
+        """Look up a key in an LRU cache, marking it as recently used"""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, cache: OrderedDict, key, value, max_size: int):
+        """Insert a value into an LRU cache, evicting the oldest entry if full"""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            if len(cache) > max_size:
+                cache.popitem(last=False)
+    
+    def _calculate_detailed_breakdown(self, technical_lower: Set[str], 
+                                    soft_lower: Set[str],
                                     experience_entries: List[Dict],
                                     education_entries: List[Dict],
-                                    job_requirements: Dict[str, Any]) -> Dict[str, Any]:
-        """Calculate detailed breakdown of all matching criteria"""
+                                    job_profile: Dict[str, Any],
+                                    text_hits: Set[str] = frozenset()) -> Dict[str, Any]:
+        """Calculate detailed breakdown of all matching criteria
+        
+        Skill sets are expected to be lowercased already and job_profile is
+        the prepared form of the job requirements built by make_scorer.
+        """
         
         # Experience analysis
         total_experience = self._calculate_total_experience(experience_entries)
-        required_years = job_requirements.get('experience_years', 0)
+        required_years = job_profile['required_years']
         experience_score = min((total_experience / required_years) * 100, 100) if required_years > 0 else 100
         
         # Skill analysis
-        required_skills = set(job_requirements.get('required_skills', []))
-        preferred_skills = set(job_requirements.get('preferred_skills', []))
+        required_skills = job_profile['required_skills']
+        preferred_skills = job_profile['preferred_skills']
         
-        required_matches = len(technical_skills.intersection(required_skills))
-        preferred_matches = len(technical_skills.intersection(preferred_skills))
+        required_matches = len(technical_lower.intersection(required_skills))
+        preferred_matches = len(technical_lower.intersection(preferred_skills))
         
-        required_score = (required_matches / len(required_skills)) * 100 if required_skills else 0
-        preferred_score = (preferred_matches / len(preferred_skills)) * 100 if preferred_skills else 0
+        required_score = required_matches * job_profile['inv_required'] * 100
+        preferred_score = preferred_matches * job_profile['inv_preferred'] * 100
         
         # Specific requirement checks
-        specific_checks = self._check_specific_requirements(technical_skills, soft_skills, experience_entries)
+        specific_checks = self._check_specific_requirements(technical_lower, soft_lower,
+                                                            experience_entries, text_hits)
         
         return {
             'experience': {
@@ -98,7 +275,7 @@ class ResumeScorer:
                 'total_preferred': len(preferred_skills),
                 'required_score': required_score,
                 'preferred_score': preferred_score,
-                'total_skills_found': len(technical_skills)
+                'total_skills_found': len(technical_lower)
             },
             'specific_requirements': specific_checks
         }
@@ -141,70 +318,64 @@ class ResumeScorer:
             return int(year_match.group())
         return None
     
-    def _get_experience_status(self, actual_years: float, required_years: float) -> str:
+    def _get_experience_status(self, actual_years: float, required_years: float) -> MatchStatus:
         """Get status for experience requirement"""
         if actual_years >= required_years:
-            return "✅ Yes"
+            return MatchStatus.YES
         elif actual_years >= required_years * 0.8:  # Within 20%
-            return "⚠️ Partial"
+            return MatchStatus.PARTIAL
         else:
-            return "❌ No"
+            return MatchStatus.NO
     
-    def _check_specific_requirements(self, technical_skills: Set[str], 
-                                   soft_skills: Set[str],
-                                   experience_entries: List[Dict]) -> Dict[str, Any]:
-        """Check specific job requirements"""
-        
-        # Convert technical_skills to lowercase for comparison
-        technical_skills_lower = {skill.lower() for skill in technical_skills}
-        soft_skills_lower = {skill.lower() for skill in soft_skills}
-        
-        # iOS Development
-        ios_skills = {'swift', 'swiftui', 'uikit', 'cocoa touch', 'ios'}
-        ios_development = any(skill.lower() in technical_skills_lower for skill in ios_skills)
-        
-        # Swift Experience
-        swift_experience = any(skill.lower() in technical_skills_lower for skill in ['swift', 'swiftui'])
-        
-        # Team Collaboration
-        collaboration_skills = {'agile', 'scrum', 'collaboration', 'team'}
-        team_collaboration = any(skill.lower() in soft_skills_lower for skill in collaboration_skills)
-        
-        # Accessibility
-        accessibility_skills = {'accessibility', 'voiceover', 'wcag', 'dynamic type'}
-        accessibility = any(skill.lower() in technical_skills_lower for skill in accessibility_skills)
-        
-        # Testing
-        testing_skills = {'xctest', 'xcuitest', 'testing', 'tdd', 'unit testing'}
-        testing = any(skill.lower() in technical_skills_lower for skill in testing_skills)
-        
-        # CI/CD
-        cicd_skills = {'jenkins', 'fastlane', 'github actions', 'ci/cd', 'bitrise'}
-        cicd = any(skill.lower() in technical_skills_lower for skill in cicd_skills)
-        
-        # Authentication
-        auth_skills = {'oauth', 'oauth 2.0', 'authentication', 'jwt'}
-        authentication = any(skill.lower() in technical_skills_lower for skill in auth_skills)
-        
-        # App Store
-        appstore_skills = {'app store connect', 'testflight', 'app store'}
-        app_store = any(skill.lower() in technical_skills_lower for skill in appstore_skills)
+    def _check_specific_requirements_text(self, text_lower: str) -> Set[str]:
+        """Find specific requirement categories evidenced in raw resume text
+        
+        Scans the text once with an Aho-Corasick automaton, so phrases the skills
+        extractor missed (e.g. "app store connect") still count.
+        """
+        hits = set()
+        for _, _, _, categories in iter_keyword_matches(_REQUIREMENT_AUTOMATON, text_lower):
+            hits.update(categories)
+        return hits
+    
+    def _check_specific_requirements(self, technical_skills_lower: Set[str], 
+                                   soft_skills_lower: Set[str],
+                                   experience_entries: List[Dict],
+                                   text_hits: Set[str] = frozenset()) -> Dict[str, Any]:
+        """Check specific job requirements against lowercased skill sets and text hits"""
+        
+        def is_met(category: str, skills_lower: Set[str]) -> bool:
+            return category in text_hits or not skills_lower.isdisjoint(SPECIFIC_REQUIREMENT_VOCAB[category])
+        
+        ios_development = is_met('ios_development', technical_skills_lower)
+        swift_experience = is_met('swift_experience', technical_skills_lower)
+        team_collaboration = is_met('team_collaboration', soft_skills_lower)
+        accessibility = is_met('accessibility', technical_skills_lower)
+        testing = is_met('testing', technical_skills_lower)
+        cicd = is_met('cicd', technical_skills_lower)
+        authentication = is_met('authentication', technical_skills_lower)
+        app_store = is_met('app_store', technical_skills_lower)
         
         # Education
         has_degree = len(experience_entries) > 0  # Simplified check
         
         return {
-            'ios_development': {'status': "✅ Yes" if ios_development else "❌ No", 'details': "Strong iOS skills found" if ios_development else "iOS skills not prominent"},
-            'swift_experience': {'status': "✅ Yes" if swift_experience else "❌ No", 'details': "Swift/SwiftUI experience confirmed" if swift_experience else "Swift experience not found"},
-            'team_collaboration': {'status': "✅ Yes" if team_collaboration else "❌ No", 'details': "Team collaboration skills present" if team_collaboration else "Team skills not mentioned"},
-            'accessibility': {'status': "✅ Yes" if accessibility else "❌ No", 'details': "Accessibility experience found" if accessibility else "Accessibility not mentioned"},
-            'testing': {'status': "✅ Yes" if testing else "❌ No", 'details': "Testing experience confirmed" if testing else "Testing experience not found"},
-            'cicd': {'status': "✅ Yes" if cicd else "❌ No", 'details': "CI/CD experience present" if cicd else "CI/CD not mentioned"},
-            'authentication': {'status': "✅ Yes" if authentication else "❌ No", 'details': "Authentication experience found" if authentication else "Auth experience not found"},
-            'app_store': {'status': "✅ Yes" if app_store else "❌ No", 'details': "App Store experience confirmed" if app_store else "App Store experience not found"},
-            'education': {'status': "✅ Yes" if has_degree else "❌ No", 'details': "Education requirements met" if has_degree else "Education requirements not met"}
+            'ios_development': {'status': self._status(ios_development), 'details': "Strong iOS skills found" if ios_development else "iOS skills not prominent"},
+            'swift_experience': {'status': self._status(swift_experience), 'details': "Swift/SwiftUI experience confirmed" if swift_experience else "Swift experience not found"},
+            'team_collaboration': {'status': self._status(team_collaboration), 'details': "Team collaboration skills present" if team_collaboration else "Team skills not mentioned"},
+            'accessibility': {'status': self._status(accessibility), 'details': "Accessibility experience found" if accessibility else "Accessibility not mentioned"},
+            'testing': {'status': self._status(testing), 'details': "Testing experience confirmed" if testing else "Testing experience not found"},
+            'cicd': {'status': self._status(cicd), 'details': "CI/CD experience present" if cicd else "CI/CD not mentioned"},
+            'authentication': {'status': self._status(authentication), 'details': "Authentication experience found" if authentication else "Auth experience not found"},
+            'app_store': {'status': self._status(app_store), 'details': "App Store experience confirmed" if app_store else "App Store experience not found"},
+            'education': {'status': self._status(has_degree), 'details': "Education requirements met" if has_degree else "Education requirements not met"}
         }
     
+    @staticmethod
+    def _status(matched: bool) -> MatchStatus:
+        """Map a boolean check to a match status"""
+        return MatchStatus.YES if matched else MatchStatus.NO
+    
     def _calculate_overall_score(self, breakdown: Dict[str, Any]) -> float:
         """Calculate overall ATS score"""
         
@@ -223,7 +394,7 @@ class ResumeScorer:
         # Specific requirements score
         specific_checks = breakdown['specific_requirements']
         specific_passed = sum(1 for check in specific_checks.values() 
-                            if "✅ Yes" in check['status'])
+                            if check['status'] == MatchStatus.YES)
         specific_score = (specific_passed / len(specific_checks)) * 100 * specific_weight
         
         overall_score = experience_score + skills_score + specific_score
@@ -245,20 +416,21 @@ class ResumeScorer:
         if len(tech_skills) > 50:
             highlights.append(f"Comprehensive technical skill set ({len(tech_skills)} skills identified)")
         
-        # Specific technology highlights
-        if any('swift' in skill.lower() for skill in tech_skills):
+        # Specific technology highlights (newline-joined so no needle spans two skills)
+        joined_skills = '\n'.join(tech_skills).lower()
+        if 'swift' in joined_skills:
             highlights.append("Expert Swift and iOS development experience")
         
-        if any('firebase' in skill.lower() for skill in tech_skills):
+        if 'firebase' in joined_skills:
             highlights.append("Strong Firebase and cloud integration experience")
         
-        if any('agile' in skill.lower() for skill in tech_skills):
+        if 'agile' in joined_skills:
             highlights.append("Agile methodology and team collaboration experience")
         
-        if any('accessibility' in skill.lower() for skill in tech_skills):
+        if 'accessibility' in joined_skills:
             highlights.append("Accessibility and inclusive design experience")
         
-        if any('testing' in skill.lower() for skill in tech_skills):
+        if 'testing' in joined_skills:
             highlights.append("Comprehensive testing and quality assurance experience")
         
         return highlights
@@ -281,7 +453,7 @@ class ResumeScorer:
         # Specific requirement gaps
         specific_checks = breakdown['specific_requirements']
         failed_checks = [name for name, check in specific_checks.items() 
-                        if "❌ No" in check['status']]
+                        if check['status'] == MatchStatus.NO]
         
         for failed in failed_checks:
             gaps.append(f"Missing: {failed.replace('_', ' ').title()}")
@@ -306,16 +478,16 @@ class ResumeScorer:
         # Specific recommendations
         specific_checks = breakdown['specific_requirements']
         
-        if "❌ No" in specific_checks.get('accessibility', {}).get('status', ''):
+        if specific_checks.get('accessibility', {}).get('status') == MatchStatus.NO:
             recommendations.append("Include accessibility experience (VoiceOver, WCAG compliance, Dynamic Type)")
         
-        if "❌ No" in specific_checks.get('testing', {}).get('status', ''):
+        if specific_checks.get('testing', {}).get('status') == MatchStatus.NO:
             recommendations.append("Highlight testing experience (XCTest, XCUITest, TDD, automated testing)")
         
-        if "❌ No" in specific_checks.get('cicd', {}).get('status', ''):
+        if specific_checks.get('cicd', {}).get('status') == MatchStatus.NO:
             recommendations.append("Add CI/CD experience (Jenkins, Fastlane, GitHub Actions, automated deployment)")
         
-        if "❌ No" in specific_checks.get('team_collaboration', {}).get('status', ''):
+        if specific_checks.get('team_collaboration', {}).get('status') == MatchStatus.NO:
             recommendations.append("Emphasize team collaboration and Agile methodology experience")
         
         return recommendations
@@ -328,7 +500,7 @@ class ResumeScorer:
         experience = breakdown['experience']
         matches.append({
             'requirement': f"{experience['required_years']}+ years experience",
-            'matched': experience['status'],
+            'matched': experience['status'].label,
             'details': f"Resume shows {experience['total_years']} years experience",
             'confidence': self._calculate_experience_confidence(experience),
             'explanation': self._explain_experience_match(experience)
@@ -349,9 +521,9 @@ class ResumeScorer:
         for req_name, check in specific_checks.items():
             matches.append({
                 'requirement': req_name.replace('_', ' ').title(),
-                'matched': check['status'],
+                'matched': check['status'].label,
                 'details': check['details'],
-                'confidence': 1.0 if "✅ Yes" in check['status'] else 0.0,
+                'confidence': 1.0 if check['status'] == MatchStatus.YES else 0.0,
                 'explanation': self._explain_specific_requirement(req_name, check)
             })
         
@@ -403,13 +575,132 @@ class ResumeScorer:
         status = check['status']
         details = check['details']
         
-        if "✅ Yes" in status:
+        if status == MatchStatus.YES:
             return f"✅ Strong evidence found: {details}"
-        elif "⚠️ Partial" in status:
+        elif status == MatchStatus.PARTIAL:
             return f"⚠️ Partial evidence: {details}"
         else:
             return f"❌ No evidence found: {details}"
     
+    def _get_embedder(self):
+        """Lazily load the sentence embedding model (FP16 on CUDA)"""
+        if self._embedder is None:
+            try:
+                import torch
+                from sentence_transformers import SentenceTransformer
+                
+                device = 'cuda' if torch.cuda.is_available() else 'cpu'
+                embedder = SentenceTransformer(EMBEDDING_MODEL, device=device)
+                if device == 'cuda':
+                    embedder = embedder.half()
+                self._embedder = embedder
+                logger.info(f"Loaded embedding model {EMBEDDING_MODEL} on {device}")
+            except Exception as e:
+                logger.warning(f"Semantic similarity disabled, could not load embedding model: {e}")
+                self.use_semantic_similarity = False
+        return self._embedder
+    
+    def calculate_semantic_similarity(self, resume_texts: List[str], job_description: str) -> List[float]:
+        """Calculate cosine similarity of each resume text to the job description
+        
+        The job description is encoded once and all resumes are encoded in a
+        single batched call, so the cost is one model pass per batch rather than
+        one per resume.
+        """
+        if not resume_texts:
+            return []
+        
+        embedder = self._get_embedder() if self.use_semantic_similarity else None
+        if embedder is None:
+            return [0.0] * len(resume_texts)
+        
+        job_embedding = self._get_embeddings(embedder, [job_description])
+        resume_embeddings = self._get_embeddings(embedder, resume_texts)
+        
+        # Embeddings are normalized, so cosine similarity is a single matmul
+        similarities = (resume_embeddings @ job_embedding.T).reshape(-1)
+        return [max(float(similarity), 0.0) for similarity in similarities]
+    
+    def _get_embeddings(self, embedder, texts: List[str]) -> np.ndarray:
+        """Return normalized embeddings for texts, encoding only cache misses"""
+        keys = [_content_hash(text) for text in texts]
+        embeddings = {}
+        missing = {}
+        
+        for key, text in zip(keys, texts):
+            cached = self._cache_get(self._emb_cache, key)
+            if cached is None:
+                missing.setdefault(key, text)
+            else:
+                embeddings[key] = cached
+        
+        if missing:
+            # Encode all misses in a single batched call
+            encoded = embedder.encode(list(missing.values()), batch_size=EMBEDDING_BATCH_SIZE,
+                                      normalize_embeddings=True, show_progress_bar=False)
+            for key, embedding in zip(missing, encoded):
+                embeddings[key] = embedding
+                self._cache_put(self._emb_cache, key, embedding, EMBEDDING_CACHE_SIZE)
+        
+        return np.vstack([embeddings[key] for key in keys])
+    
+    def rank_resumes(self, resumes: List[Dict[str, Any]], job_description: str,
+                     job_requirements: Optional[Dict[str, Any]] = None,
+                     max_workers: Optional[int] = None,
+                     top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rank analyzed resumes against a job description
+        
+        Args:
+            resumes: Resume analyses as produced by ResumeScreener.analyze_resume
+            job_description: Job description text
+            job_requirements: Optional ATS requirements used for the ATS score
+            max_workers: Score resumes on a thread pool of this size; scoring
+                runs inline when None or 1
+            top_k: Only return the top_k best entries
+            
+        Returns:
+            List of ranking entries sorted by score (0-1), best first
+        """
+        similarities = self.calculate_semantic_similarity(
+            [resume.get('text', '') for resume in resumes], job_description
+        )
+        
+        score_fn = self.make_scorer(job_requirements) if job_requirements is not None else None
+        
+        def build_entry(item) -> Dict[str, Any]:
+            resume, similarity = item
+            entry = {
+                'filename': resume.get('filename', ''),
+                'semantic_similarity': similarity
+            }
+            
+            if score_fn is not None:
+                ats_analysis = score_fn(resume)
+                ats_score = ats_analysis['overall_score'] / 100.0
+                entry['ats_score'] = ats_analysis['overall_score']
+                entry['breakdown'] = ats_analysis['breakdown']
+                if self.use_semantic_similarity:
+                    entry['score'] = (1 - SEMANTIC_WEIGHT) * ats_score + SEMANTIC_WEIGHT * similarity
+                else:
+                    entry['score'] = ats_score
+            else:
+                entry['score'] = similarity
+            
+            return entry
+        
+        items = list(zip(resumes, similarities))
+        if max_workers and max_workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                ranked_resumes = list(executor.map(build_entry, items))
+        else:
+            ranked_resumes = [build_entry(item) for item in items]
+        
+        if top_k is not None:
+            return heapq.nlargest(top_k, ranked_resumes, key=operator.itemgetter('score'))
+        
+        ranked_resumes.sort(key=operator.itemgetter('score'), reverse=True)
+        return ranked_resumes
+    
     def generate_skill_breakdown(self, resume_skills: Set[str], job_skills: List[str]) -> Dict[str, Any]:
         """Generate detailed skill breakdown with explanations"""
         breakdown = {
@@ -431,11 +722,12 @@ class ResumeScorer:
                 breakdown['confidence_scores'][job_skill] = 1.0
             else:
                 # Check for fuzzy matches
+                fuzz = _fuzz()
                 best_match = None
                 best_score = 0
                 
                 for resume_skill in resume_skills:
-                    score = fuzz.ratio(job_skill.lower(), resume_skill.lower())
+                    score = round(fuzz.ratio(job_skill.lower(), resume_skill.lower()))
                     if score > best_score and score >= 70:
                         best_score = score
                         best_match = resume_skill
@@ -3,22 +3,55 @@ Advanced Skills Extraction Engine
 Provides context-aware skill extraction with fuzzy matching and normalization
 """
 
+import functools
 import logging
 import re
-from typing import Dict, List, Set, Tuple, Any
-from dataclasses import dataclass
+import threading
+from typing import Dict, List, NamedTuple, Set, Tuple, Any
+import numpy as np
 from rapidfuzz import fuzz, process
 import spacy
-from spacy.matcher import PhraseMatcher, Matcher
+from spacy.matcher import Matcher
 from spacy.tokens import Doc, Span
 
-# Import centralized logging
-from utils import setup_logging
+from utils import build_keyword_automaton, iter_keyword_matches
+
+# Logging is configured by the application (see utils.setup_logging)
 logger = logging.getLogger(__name__)
 
-@dataclass
-class SkillMatch:
-    """Represents a skill match with context"""
+# Extraction only needs token text and sentence boundaries
+UNUSED_PIPES = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+EXTRACTION_CACHE_SIZE = 1024
+
+# Precompiled patterns used on every extraction
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+# List separators: "X, Y and Z" or "X or Y"
+_LIST_SPLIT_RE = re.compile(r'\s*(?:,|\band\b|\bor\b)\s*', re.IGNORECASE)
+# Responsibility statements: "responsible for X", "led X", "deployed X", ...
+# (matched against sentences of the lowercased Doc, so no IGNORECASE)
+_RESPONSIBILITY_RE = re.compile(
+    r'(?:responsible for|in charge of|managed|led|oversaw|developed|created|built|'
+    r'implemented|integrated|configured|deployed|maintained)\s+([^.]*)'
+)
+# Words signalling hands-on use of a skill within a sentence
+_CONTEXT_RE = re.compile(
+    r'\b(?:used|utilized|implemented|developed|built|created|designed|integrated|configured|'
+    r'experience|proficient|skilled|expert|responsible|managed|led|oversaw)\b'
+)
+# Skill followed by a version: Swift 5.7, Xcode 14, Version 1.2.3
+_VERSION_RE = re.compile(r'(\w+)\s+(\d+(?:\.\d+){0,2})')
+# Skill names classified as soft skills in extraction results
+_SOFT_SKILLS = frozenset({
+    'agile', 'scrum', 'collaboration', 'team', 'leadership', 'communication',
+    'problem solving', 'critical thinking', 'adaptability', 'creativity',
+    'time management', 'organization', 'attention to detail', 'analytical',
+    'strategic thinking', 'mentoring', 'coaching', 'presentation',
+    'sprint planning', 'backlog grooming', 'retrospectives'
+})
+
+class SkillMatch(NamedTuple):
+    """Represents a skill match with context (a tuple, so cheap to create in bulk)"""
     skill: str
     confidence: float
     context: str
@@ -31,31 +64,64 @@ class AdvancedSkillsExtractor:
     
     def __init__(self):
         """Initialize the advanced skills extractor"""
-        # Load spaCy model with better error handling
-        self.nlp = self._load_spacy_model()
+        # spaCy model and context matcher are loaded on first use (see nlp)
+        self._nlp = None
+        self.matcher = None
+        self._nlp_lock = threading.Lock()
         
         # Initialize skill ontology
         self.skill_ontology = self._build_skill_ontology()
         
-        # Initialize matchers
-        self._setup_matchers()
+        # Flattened views of the ontology for the matching loops; variations are
+        # lowercased once here and keep their order (earlier skills win lookups)
+        self._skill_variations = [
+            (skill_name, tuple(dict.fromkeys(variation.lower() for variation in skill_info['variations'])))
+            for skill_name, skill_info in self.skill_ontology.items()
+        ]
+        self._all_variations = [
+            variation for _, variations in self._skill_variations for variation in variations
+        ]
+        self._all_variations_sorted = sorted(dict.fromkeys(self._all_variations), key=len, reverse=True)
+        self._variation_to_skill = self._build_variation_index()
+        self._variation_skills = self._build_variation_skills()
+        self._automaton = build_keyword_automaton(self._variation_skills)
+        self._variation_re = self._build_variation_pattern()
+        
+        # Per-instance cache of extraction results keyed by the input text
+        self._extract_cached = functools.lru_cache(maxsize=EXTRACTION_CACHE_SIZE)(self._extract_skill_lists)
         
         logger.info("Advanced Skills Extractor initialized")
     
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded together with the context matcher on first access
+        
+        Loading is guarded by a lock so concurrent first calls load the model
+        once; the pipeline is published only after its matcher is ready.
+        """
+        if self._nlp is None:
+            with self._nlp_lock:
+                if self._nlp is None:
+                    # Load spaCy model with better error handling
+                    nlp = self._load_spacy_model()
+                    self._setup_matchers(nlp)
+                    self._nlp = nlp
+        return self._nlp
+    
     def _load_spacy_model(self):
         """Load spaCy model with comprehensive error handling"""
         model_name = "en_core_web_sm"
         
         try:
             # Try to load the model
-            return spacy.load(model_name)
+            return self._load_pipeline(model_name)
         except OSError:
             logger.warning(f"spaCy model '{model_name}' not found.")
             
             # Try automatic installation
             if self._try_install_spacy_model(model_name):
                 try:
-                    return spacy.load(model_name)
+                    return self._load_pipeline(model_name)
                 except OSError as e:
                     logger.error(f"Failed to load model after installation: {e}")
             
@@ -63,6 +129,15 @@ class AdvancedSkillsExtractor:
             logger.warning("Attempting to use fallback spaCy model...")
             return self._create_fallback_model()
     
+    def _load_pipeline(self, model_name):
+        """Load a spaCy model without the components extraction never uses"""
+        nlp = spacy.load(model_name, exclude=UNUSED_PIPES)
+        
+        # Cheap rule-based sentence boundaries instead of the dependency parser
+        if "sentencizer" not in nlp.pipe_names:
+            nlp.add_pipe("sentencizer")
+        return nlp
+    
     def _try_install_spacy_model(self, model_name):
         """Try to install spaCy model with better error handling"""
         try:
@@ -104,13 +179,8 @@ class AdvancedSkillsExtractor:
             logger.info("Creating minimal fallback English model")
             nlp = English()
             
-            # Add basic pipeline components
-            if "tagger" not in nlp.pipe_names:
-                nlp.add_pipe("tagger")
-            if "parser" not in nlp.pipe_names:
-                nlp.add_pipe("parser")
-            if "ner" not in nlp.pipe_names:
-                nlp.add_pipe("ner")
+            # Sentence boundaries are the only annotation extraction relies on
+            nlp.add_pipe("sentencizer")
             
             logger.warning("Using minimal fallback model - some features may be limited")
             return nlp
@@ -551,21 +621,36 @@ class AdvancedSkillsExtractor:
             }
         }
     
-    def _setup_matchers(self):
+    def _build_variation_index(self) -> Dict[str, str]:
+        """Map each variation to its skill name (first skill in the ontology wins)"""
+        index = {}
+        for skill_name, variations in self._skill_variations:
+            for variation in variations:
+                index.setdefault(variation, skill_name)
+        return index
+    
+    def _setup_matchers(self, nlp):
         """Setup spaCy matchers for pattern matching"""
-        self.phrase_matcher = PhraseMatcher(self.nlp.vocab)
-        self.matcher = Matcher(self.nlp.vocab)
+        self.matcher = Matcher(nlp.vocab)
         
-        # Add patterns for skill detection
-        self._add_skill_patterns()
+        # Add patterns for context-aware skill detection
         self._add_context_patterns()
     
-    def _add_skill_patterns(self):
-        """Add patterns for direct skill mentions"""
-        # Add all skill variations to phrase matcher
-        for skill_name, skill_info in self.skill_ontology.items():
-            patterns = [self.nlp(text) for text in skill_info['variations']]
-            self.phrase_matcher.add(skill_name, patterns)
+    def _build_variation_skills(self) -> Dict[str, Tuple[str, ...]]:
+        """Map each variation to all skills listing it, in ontology order"""
+        skills_by_variation = {}
+        for skill_name, variations in self._skill_variations:
+            for variation in variations:
+                skills = skills_by_variation.setdefault(variation, [])
+                if skill_name not in skills:
+                    skills.append(skill_name)
+        
+        return {variation: tuple(skills) for variation, skills in skills_by_variation.items()}
+    
+    def _build_variation_pattern(self):
+        """Compile one whole-word alternation over all variations, longest first"""
+        alternation = '|'.join(re.escape(variation) for variation in self._all_variations_sorted)
+        return re.compile(r'(?<!\w)(?:' + alternation + r')(?!\w)')
     
     def _add_context_patterns(self):
         """Add patterns for context-aware skill detection"""
@@ -598,16 +683,59 @@ class AdvancedSkillsExtractor:
         if not text:
             return {'technical_skills': [], 'soft_skills': [], 'all_skills': []}
         
+        return self._skills_result(*self._extract_cached(text))
+    
+    def extract_skills_batch(self, texts: List[str], batch_size: int = 64,
+                             n_process: int = 1) -> List[Dict[str, List[str]]]:
+        """Extract skills from many texts, running spaCy over them in batches
+        
+        Args:
+            texts: Texts to extract skills from
+            batch_size: Number of texts per spaCy batch
+            n_process: Number of spaCy worker processes
+            
+        Returns:
+            One extract_skills result per text, in input order
+        """
+        docs = self.nlp.pipe((text.lower() for text in texts), batch_size=batch_size, n_process=n_process)
+        
+        results = []
+        for doc, text in zip(docs, texts):
+            if not text:
+                results.append(self._skills_result((), ()))
+            else:
+                results.append(self._skills_result(*self._process_doc(doc, text)))
+        return results
+    
+    @staticmethod
+    def _skills_result(technical_skills: Tuple[str, ...], 
+                       soft_skills: Tuple[str, ...]) -> Dict[str, List[str]]:
+        """Build the public extract_skills result from skill tuples"""
+        return {
+            'technical_skills': list(technical_skills),
+            'soft_skills': list(soft_skills),
+            'all_skills': list(technical_skills + soft_skills)
+        }
+    
+    def _extract_skill_lists(self, text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Run the extraction pipeline, returning (technical, soft) skill tuples"""
         # Process text with spaCy
-        doc = self.nlp(text.lower())
+        return self._process_doc(self.nlp(text.lower()), text)
+    
+    def _process_doc(self, doc: Doc, text: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Extract (technical, soft) skill tuples from text and its lowercased Doc"""
+        text_lower = doc.text
         
         # Extract skills using multiple methods
-        skill_matches = self._extract_with_phrase_matcher(doc)
-        skill_matches.extend(self._extract_with_fuzzy_matching(text))
+        skill_matches = self._extract_with_automaton(text_lower)
+        
+        # Words inside exact variation matches need no fuzzy scoring
+        matched_tokens = {word for match in skill_matches for word in match.context.split()}
+        skill_matches.extend(self._extract_with_fuzzy_matching(text, matched_tokens))
         skill_matches.extend(self._extract_with_context_patterns(doc))
         
         # Fallback: direct keyword matching for comprehensive coverage
-        skill_matches.extend(self._extract_with_direct_matching(text))
+        skill_matches.extend(self._extract_with_direct_matching(text_lower))
         
         # Normalize and deduplicate skills
         normalized_skills = self._normalize_skills(skill_matches)
@@ -628,93 +756,88 @@ class AdvancedSkillsExtractor:
                 if self._is_soft_skill(skill):
                     soft_skills.append(skill)
         
-        return {
-            'technical_skills': technical_skills,
-            'soft_skills': soft_skills,
-            'all_skills': technical_skills + soft_skills
-        }
+        return tuple(technical_skills), tuple(soft_skills)
     
-    def _extract_with_phrase_matcher(self, doc: Doc) -> List[SkillMatch]:
-        """Extract skills using spaCy phrase matcher"""
+    def _extract_with_automaton(self, text_lower: str) -> List[SkillMatch]:
+        """Extract skills whose variations appear verbatim in the lowercased text"""
         matches = []
         
-        for match_id, start, end in self.phrase_matcher(doc):
-            skill_name = self.nlp.vocab.strings[match_id]
-            span = doc[start:end]
-            
-            matches.append(SkillMatch(
-                skill=skill_name,
-                confidence=1.0,
-                context=span.text,
-                position=(start, end)
-            ))
+        for start, end, variation, skill_names in iter_keyword_matches(self._automaton, text_lower):
+            for skill_name in skill_names:
+                matches.append(SkillMatch(
+                    skill=skill_name,
+                    confidence=1.0,
+                    context=variation,
+                    position=(start, end)
+                ))
         
         return matches
     
-    def _extract_with_fuzzy_matching(self, text: str) -> List[SkillMatch]:
-        """Extract skills using fuzzy matching with enhanced pattern recognition"""
+    def _extract_with_fuzzy_matching(self, text: str, 
+                                     skip_words: Set[str] = frozenset()) -> List[SkillMatch]:
+        """Extract skills using fuzzy matching with enhanced pattern recognition
+        
+        Args:
+            text: Resume text
+            skip_words: Lowercase words already matched exactly elsewhere
+        """
         matches = []
         
         # Get all possible skill variations
-        all_variations = []
-        for skill_name, skill_info in self.skill_ontology.items():
-            all_variations.extend(skill_info['variations'])
+        all_variations = self._all_variations
         
         # Use RapidFuzz for fuzzy matching with multiple strategies
         words = text.split()
         
         # Strategy 1: Word-level fuzzy matching
+        fuzzy_words = []
+        fuzzy_queries = []
         for word in words:
             # Clean word
-            clean_word = re.sub(r'[^\w\s]', '', word.lower())
-            if len(clean_word) < 3:
+            clean_word = _NON_WORD_RE.sub('', word.lower())
+            if len(clean_word) < 3 or clean_word in skip_words:
                 continue
             
-            # Find best matches with multiple scorers
-            best_matches_ratio = process.extract(clean_word, all_variations, 
-                                              scorer=fuzz.ratio, limit=3)
-            best_matches_partial = process.extract(clean_word, all_variations, 
-                                                scorer=fuzz.partial_ratio, limit=3)
-            best_matches_token = process.extract(clean_word, all_variations, 
-                                              scorer=fuzz.token_sort_ratio, limit=3)
-            
-            # Combine results and find best matches
-            all_matches = {}
-            for match, score, index in best_matches_ratio + best_matches_partial + best_matches_token:
-                if match not in all_matches:
-                    all_matches[match] = score
-                else:
-                    all_matches[match] = max(all_matches[match], score)
-            
-            # Filter high-confidence matches
-            for match, score in all_matches.items():
-                if score >= 75:  # Lower confidence threshold for better coverage
-                    skill_name = self._find_skill_by_variation(match)
-                    if skill_name:
-                        matches.append(SkillMatch(
-                            skill=skill_name,
-                            confidence=score / 100.0,
-                            context=word,
-                            position=(0, 0)
-                        ))
+            # Exact variation hits need no fuzzy scoring
+            skill_name = self._variation_to_skill.get(clean_word)
+            if skill_name:
+                matches.append(SkillMatch(
+                    skill=skill_name,
+                    confidence=1.0,
+                    context=word,
+                    position=(0, 0)
+                ))
+                continue
+            
+            # Very short words produce mostly spurious fuzzy hits
+            if len(clean_word) < 4:
+                continue
+            
+            fuzzy_words.append(word)
+            fuzzy_queries.append(clean_word)
+        
+        if fuzzy_queries:
+            # Resumes repeat words heavily, so score each distinct word only once
+            query_rows = {}
+            row_indices = [query_rows.setdefault(query, len(query_rows)) for query in fuzzy_queries]
+            
+            # Score every remaining word against every variation in one call;
+            # WRatio blends ratio, partial and token-sort scoring
+            unique_scores = process.cdist(list(query_rows), all_variations, scorer=fuzz.WRatio,
+                                          score_cutoff=75, workers=-1)
+            scores = unique_scores[row_indices]
+            
+            # Lower confidence threshold for better coverage
+            matches.extend(self._collect_fuzzy_matches(scores, all_variations, fuzzy_words, 75))
         
         # Strategy 2: Phrase-level matching for multi-word skills
-        phrases = self._extract_phrases(text)
-        for phrase in phrases:
-            if len(phrase.split()) >= 2:  # Multi-word phrases
-                best_matches = process.extract(phrase, all_variations, 
-                                            scorer=fuzz.partial_ratio, limit=3)
-                
-                for match, score, index in best_matches:
-                    if score >= 80:  # Higher threshold for phrases
-                        skill_name = self._find_skill_by_variation(match)
-                        if skill_name:
-                            matches.append(SkillMatch(
-                                skill=skill_name,
-                                confidence=score / 100.0,
-                                context=phrase,
-                                position=(0, 0)
-                            ))
+        phrases = [phrase for phrase in self._extract_phrases(text) if len(phrase.split()) >= 2]
+        if phrases:
+            scores = process.cdist(phrases, all_variations, scorer=fuzz.partial_ratio,
+                                   score_cutoff=80, dtype=np.uint8, workers=-1)
+            
+            # Higher threshold for phrases
+            matches.extend(self._collect_fuzzy_matches(scores, all_variations, phrases, 80))
         
         # Strategy 3: Version-aware matching
         version_matches = self._extract_version_aware_skills(text)
@@ -722,29 +845,53 @@ class AdvancedSkillsExtractor:
         
         return matches
     
+    def _collect_fuzzy_matches(self, scores: np.ndarray, variations: List[str],
+                               contexts: List[str], threshold: float,
+                               limit: int = 3) -> List[SkillMatch]:
+        """Turn a cdist score matrix into matches for the best variations per row
+        
+        Args:
+            scores: Score matrix of shape (len(contexts), len(variations))
+            variations: Variations scored against, in column order
+            contexts: Text scored for each row
+            threshold: Minimum score for a match
+            limit: Maximum matches kept per row
+        """
+        matches = []
+        
+        # Only rank rows that have at least one score above the threshold
+        hit_rows = np.flatnonzero(scores.max(axis=1) >= threshold)
+        if not hit_rows.size:
+            return matches
+        
+        row_scores = scores[hit_rows].astype(np.float32)
+        best_columns = np.argsort(-row_scores, axis=1, kind='stable')[:, :limit]
+        best_scores = np.take_along_axis(row_scores, best_columns, axis=1)
+        
+        for hit, rank in zip(*np.nonzero(best_scores >= threshold)):
+            skill_name = self._find_skill_by_variation(variations[best_columns[hit, rank]])
+            if skill_name:
+                matches.append(SkillMatch(
+                    skill=skill_name,
+                    confidence=float(best_scores[hit, rank]) / 100.0,
+                    context=contexts[hit_rows[hit]],
+                    position=(0, 0)
+                ))
+        
+        return matches
+    
     def _extract_phrases(self, text: str) -> List[str]:
         """Extract meaningful phrases from text"""
         phrases = []
         
         # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENT_SPLIT_RE.split(text)
         
         for sentence in sentences:
-            # Extract phrases with common patterns
-            # Pattern: "X and Y" or "X, Y, and Z"
-            and_patterns = re.findall(r'\b(\w+(?:\s+\w+)*)\s+and\s+(\w+(?:\s+\w+)*)\b', sentence, re.IGNORECASE)
-            for match in and_patterns:
-                phrases.extend(match)
-            
-            # Pattern: "X, Y, Z" (comma-separated lists)
-            comma_patterns = re.findall(r'\b(\w+(?:\s+\w+)*)\s*,\s*(\w+(?:\s+\w+)*)\s*,\s*(\w+(?:\s+\w+)*)\b', sentence, re.IGNORECASE)
-            for match in comma_patterns:
-                phrases.extend(match)
-            
-            # Pattern: "X or Y"
-            or_patterns = re.findall(r'\b(\w+(?:\s+\w+)*)\s+or\s+(\w+(?:\s+\w+)*)\b', sentence, re.IGNORECASE)
-            for match in or_patterns:
-                phrases.extend(match)
+            # Split list-like sentences on their separators in a single pass
+            parts = _LIST_SPLIT_RE.split(sentence)
+            if len(parts) > 1:
+                phrases.extend(part.strip() for part in parts if part.strip())
         
         return phrases
     
@@ -752,28 +899,20 @@ class AdvancedSkillsExtractor:
         """Extract skills with version information"""
         matches = []
         
-        # Version patterns
-        version_patterns = [
-            r'(\w+)\s+(\d+\.\d+)',  # Swift 5.7
-            r'(\w+)\s+(\d+)',        # Xcode 14
-            r'(\w+)\s+(\d+\.\d+\.\d+)',  # Version 1.2.3
-        ]
-        
-        for pattern in version_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                skill_candidate = match.group(1).lower()
-                version = match.group(2)
-                
-                # Check if this is a known skill
-                skill_name = self._find_skill_by_variation(skill_candidate)
-                if skill_name:
-                    matches.append(SkillMatch(
-                        skill=skill_name,
-                        confidence=0.95,  # High confidence for version-specific matches
-                        context=f"{skill_candidate} {version}",
-                        position=(match.start(), match.end()),
-                        version=version
-                    ))
+        for match in _VERSION_RE.finditer(text):
+            skill_candidate = match.group(1).lower()
+            version = match.group(2)
+            
+            # Check if this is a known skill
+            skill_name = self._find_skill_by_variation(skill_candidate)
+            if skill_name:
+                matches.append(SkillMatch(
+                    skill=skill_name,
+                    confidence=0.95,  # High confidence for version-specific matches
+                    context=f"{skill_candidate} {version}",
+                    position=(match.start(), match.end()),
+                    version=version
+                ))
         
         return matches
     
@@ -785,146 +924,118 @@ class AdvancedSkillsExtractor:
         for match_id, start, end in self.matcher(doc):
             span = doc[start:end]
             
-            # Look for skill mentions in the context
-            for skill_name, skill_info in self.skill_ontology.items():
-                for variation in skill_info['variations']:
-                    if variation in span.text.lower():
-                        matches.append(SkillMatch(
-                            skill=skill_name,
-                            confidence=0.8,  # Lower confidence for context-based matches
-                            context=span.text,
-                            position=(start, end)
-                        ))
-                        break
-        
-        # Method 2: Sentence-level context analysis
+            # Look for skill mentions in the context (doc text is already lowercase)
+            span_skills = []
+            for variation_match in self._variation_re.finditer(span.text):
+                for skill_name in self._variation_skills[variation_match.group()]:
+                    if skill_name not in span_skills:
+                        span_skills.append(skill_name)
+            
+            for skill_name in span_skills:
+                matches.append(SkillMatch(
+                    skill=skill_name,
+                    confidence=0.8,  # Lower confidence for context-based matches
+                    context=span.text,
+                    position=(start, end)
+                ))
+        
+        # Method 2: Sentence-level context and responsibility analysis
         sentence_matches = self._extract_skills_from_sentences(doc)
         matches.extend(sentence_matches)
         
-        # Method 3: Responsibility pattern matching
-        responsibility_matches = self._extract_skills_from_responsibilities(doc)
-        matches.extend(responsibility_matches)
-        
         return matches
     
     def _extract_skills_from_sentences(self, doc: Doc) -> List[SkillMatch]:
-        """Extract skills from sentence-level context"""
-        matches = []
+        """Extract skills from sentence-level context of a lowercased Doc
+        
+        Responsibility statements and context indicators are detected in the
+        same pass over the sentences. Emits one match per skill, taken from
+        the first sentence with the strongest context for it.
+        """
+        best_matches = {}
         
         for sent in doc.sents:
-            sent_text = sent.text.lower()
+            sent_text = sent.text
             
             # Look for skill mentions in sentences
-            for skill_name, skill_info in self.skill_ontology.items():
-                for variation in skill_info['variations']:
-                    if variation in sent_text:
-                        # Check if the sentence contains context indicators
-                        context_indicators = [
-                            'used', 'utilized', 'implemented', 'developed', 'built',
-                            'created', 'designed', 'integrated', 'configured',
-                            'experience', 'proficient', 'skilled', 'expert',
-                            'responsible', 'managed', 'led', 'oversaw'
-                        ]
-                        
-                        has_context = any(indicator in sent_text for indicator in context_indicators)
-                        
-                        matches.append(SkillMatch(
-                            skill=skill_name,
-                            confidence=0.9 if has_context else 0.7,
-                            context=sent.text,
-                            position=(sent.start, sent.end)
-                        ))
-                        break
-        
-        return matches
-    
-    def _extract_skills_from_responsibilities(self, doc: Doc) -> List[SkillMatch]:
-        """Extract skills from responsibility statements"""
-        matches = []
-        
-        # Common responsibility patterns
-        responsibility_patterns = [
-            r'responsible for\s+([^.]*)',
-            r'in charge of\s+([^.]*)',
-            r'managed\s+([^.]*)',
-            r'led\s+([^.]*)',
-            r'oversaw\s+([^.]*)',
-            r'developed\s+([^.]*)',
-            r'created\s+([^.]*)',
-            r'built\s+([^.]*)',
-            r'implemented\s+([^.]*)',
-            r'integrated\s+([^.]*)',
-            r'configured\s+([^.]*)',
-            r'deployed\s+([^.]*)',
-            r'maintained\s+([^.]*)'
-        ]
-        
-        text = doc.text
-        
-        for pattern in responsibility_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                responsibility_text = match.group(1).lower()
-                
-                # Look for skills in the responsibility text
-                for skill_name, skill_info in self.skill_ontology.items():
-                    for variation in skill_info['variations']:
-                        if variation in responsibility_text:
-                            matches.append(SkillMatch(
-                                skill=skill_name,
-                                confidence=0.95,  # High confidence for responsibility-based matches
-                                context=match.group(0),
-                                position=(match.start(), match.end())
-                            ))
-                            break
+            sentence_skills = self._find_skills_in(sent_text)
+            if not sentence_skills:
+                continue
+            
+            # Skills named in a responsibility statement get the highest confidence
+            offset = sent.start_char
+            for match in _RESPONSIBILITY_RE.finditer(sent_text):
+                for skill_name in self._find_skills_in(match.group(1)):
+                    current = best_matches.get(skill_name)
+                    if current is not None and current.confidence >= 0.95:
+                        continue
+                    best_matches[skill_name] = SkillMatch(
+                        skill=skill_name,
+                        confidence=0.95,
+                        context=match.group(0),
+                        position=(offset + match.start(), offset + match.end())
+                    )
+            
+            # Check if the sentence contains context indicators
+            has_context = _CONTEXT_RE.search(sent_text) is not None
+            confidence = 0.9 if has_context else 0.7
+            
+            for skill_name in sentence_skills:
+                # Skip skills already seen with at least this much context
+                current = best_matches.get(skill_name)
+                if current is not None and current.confidence >= confidence:
+                    continue
+                best_matches[skill_name] = SkillMatch(
+                    skill=skill_name,
+                    confidence=confidence,
+                    context=sent_text,
+                    position=(sent.start, sent.end)
+                )
         
-        return matches
+        return list(best_matches.values())
     
-    def _extract_with_direct_matching(self, text: str) -> List[SkillMatch]:
+    def _extract_with_direct_matching(self, text_lower: str) -> List[SkillMatch]:
         """Extract skills using direct keyword matching as fallback"""
         matches = []
-        text_lower = text.lower()
+        matched_skills = set()
         
-        for skill_name, skill_info in self.skill_ontology.items():
-            for variation in skill_info['variations']:
-                if variation in text_lower:
-                    matches.append(SkillMatch(
-                        skill=skill_name,
-                        confidence=0.9,  # High confidence for direct matches
-                        context=variation,
-                        position=(0, 0)
-                    ))
-                    break  # Only match the first variation to avoid duplicates
+        # Longest variation at each position, so "swift ui" wins over "swift"
+        for _, _, variation, skill_names in iter_keyword_matches(self._automaton, text_lower, longest=True):
+            for skill_name in skill_names:
+                # Only match the first variation found to avoid duplicates
+                if skill_name in matched_skills:
+                    continue
+                matched_skills.add(skill_name)
+                matches.append(SkillMatch(
+                    skill=skill_name,
+                    confidence=0.9,  # High confidence for direct matches
+                    context=variation,
+                    position=(0, 0)
+                ))
         
         return matches
     
+    def _find_skills_in(self, text_lower: str) -> List[str]:
+        """List skills with a whole-word variation in lowercase text, without duplicates"""
+        skills = []
+        for _, _, _, skill_names in iter_keyword_matches(self._automaton, text_lower):
+            for skill_name in skill_names:
+                if skill_name not in skills:
+                    skills.append(skill_name)
+        return skills
+    
     def _find_skill_by_variation(self, variation: str) -> str:
         """Find the main skill name for a given variation"""
-        for skill_name, skill_info in self.skill_ontology.items():
-            if variation in skill_info['variations']:
-                return skill_name
-        return ""
+        return self._variation_to_skill.get(variation, "")
     
     def _normalize_skills(self, skill_matches: List[SkillMatch]) -> List[str]:
-        """Normalize and deduplicate skills"""
-        normalized = set()
-        
-        for match in skill_matches:
-            # Use the main skill name
-            normalized.add(match.skill)
-        
-        return list(normalized)
+        """Normalize and deduplicate skills, in order of first appearance"""
+        # Only the names are returned, so an insertion-ordered key set is enough
+        return list(dict.fromkeys(match.skill for match in skill_matches))
     
     def _is_soft_skill(self, skill: str) -> bool:
         """Check if a skill is a soft skill"""
-        soft_skills = {
-            'agile', 'scrum', 'collaboration', 'team', 'leadership', 'communication',
-            'problem solving', 'critical thinking', 'adaptability', 'creativity',
-            'time management', 'organization', 'attention to detail', 'analytical',
-            'strategic thinking', 'mentoring', 'coaching', 'presentation',
-            'sprint planning', 'backlog grooming', 'retrospectives'
-        }
-        
-        return skill.lower() in soft_skills
+        return skill.lower() in _SOFT_SKILLS
     
     def extract_technical_skills(self, text: str) -> Set[str]:
         """Extract technical skills (backward compatibility)"""
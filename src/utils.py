@@ -4,14 +4,30 @@ Helper functions for the AI Resume Screener
 """
 
 import os
+import heapq
 import json
 import logging
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from importlib.util import find_spec
 from typing import Dict, Any
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON encoder
+    orjson = None
 
 # Centralized logging setup
 logger = logging.getLogger(__name__)
 
+# Timestamp format used in summary reports
+REPORT_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Threads used to read job description files concurrently
+JOB_LOADER_WORKERS = 8
+
 
 def setup_logging(log_file: str = 'logs/resume_screener.log', force: bool = False):
     """Setup centralized logging configuration
@@ -64,6 +80,69 @@ def setup_logging(log_file: str = 'logs/resume_screener.log', force: bool = Fals
     return logger
 
 
+def build_keyword_automaton(keywords: Dict[str, Any]):
+    """Build an Aho-Corasick automaton over lowercase keywords
+    
+    Args:
+        keywords: Mapping of keyword to the payload reported for each match
+        
+    Returns:
+        ahocorasick.Automaton ready for iter_keyword_matches
+    """
+    import ahocorasick
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, payload in keywords.items():
+        automaton.add_word(keyword, (keyword, payload))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Check if a character is part of a word for keyword boundaries"""
+    return char.isalnum() or char == '_'
+
+
+def iter_keyword_matches(automaton, text: str, longest: bool = False):
+    """Scan text once and yield whole-word keyword matches
+    
+    Args:
+        automaton: Automaton from build_keyword_automaton
+        text: Lowercase text to scan
+        longest: Only report the longest whole-word keyword at each position,
+            scanning left to right without overlaps
+    
+    Yields:
+        (start, end, keyword, payload) for each match not embedded in a longer word
+    """
+    matches = _iter_whole_word_matches(automaton, text)
+    if not longest:
+        yield from matches
+        return
+    
+    # Word boundaries are checked before picking the longest match, so a
+    # keyword cut mid-word ("xcode cloud" in "xcode cloudkit") leaves the
+    # shorter whole-word keyword at that position in place
+    last_end = 0
+    for match in sorted(matches, key=lambda m: (m[0], m[0] - m[1])):
+        if match[0] >= last_end:
+            last_end = match[1]
+            yield match
+
+
+def _iter_whole_word_matches(automaton, text: str):
+    """Yield every keyword match not embedded in a longer word, by end position"""
+    text_length = len(text)
+    for end_index, (keyword, payload) in automaton.iter(text):
+        start = end_index - len(keyword) + 1
+        end = end_index + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < text_length and _is_word_char(text[end]):
+            continue
+        yield start, end, keyword, payload
+
+
 def create_directory_structure():
     """Create necessary directories for the project"""
     directories = [
@@ -76,62 +155,22 @@ def create_directory_structure():
     
     for directory in directories:
         os.makedirs(directory, exist_ok=True)
-        logger.info(f"Created directory: {directory}")
+        logger.info("Created directory: %s", directory)
 
 
 def print_dependency_status():
     """Print the status of all dependencies"""
-    dependencies = {
-        'spacy': False,
-        'sentence_transformers': False,
-        'sklearn': False,
-        'pandas': False,
-        'numpy': False,
-        'pdfplumber': False,
-        'python-docx': False
+    # Display name -> importable module; find_spec checks without importing
+    modules = {
+        'spacy': 'spacy',
+        'sentence_transformers': 'sentence_transformers',
+        'sklearn': 'sklearn',
+        'pandas': 'pandas',
+        'numpy': 'numpy',
+        'pdfplumber': 'pdfplumber',
+        'python-docx': 'docx'
     }
-    
-    try:
-        import pandas
-        dependencies['pandas'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import numpy
-        dependencies['numpy'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import spacy
-        dependencies['spacy'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import pdfplumber
-        dependencies['pdfplumber'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import sklearn
-        dependencies['sklearn'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import sentence_transformers
-        dependencies['sentence_transformers'] = True
-    except ImportError:
-        pass
-    
-    try:
-        import docx
-        dependencies['python-docx'] = True
-    except ImportError:
-        pass
+    dependencies = {name: find_spec(module) is not None for name, module in modules.items()}
     
     print("\n" + "="*40)
     print("DEPENDENCY STATUS")
@@ -158,14 +197,15 @@ def create_summary_report(ranked_resumes, job_description: str):
     if not ranked_resumes:
         return {}
     
-    # Calculate statistics
+    # Calculate statistics from a single pass over the scores
     total_resumes = len(ranked_resumes)
-    avg_score = sum(r['score'] for r in ranked_resumes) / total_resumes
-    max_score = max(r['score'] for r in ranked_resumes)
-    min_score = min(r['score'] for r in ranked_resumes)
+    scores = np.fromiter((r['score'] for r in ranked_resumes), dtype=np.float64, count=total_resumes)
+    avg_score = float(scores.mean())
+    max_score = float(scores.max())
+    min_score = float(scores.min())
     
-    # Top candidates
-    top_candidates = ranked_resumes[:min(5, len(ranked_resumes))]
+    # Top candidates by score, without relying on the caller's ordering
+    top_candidates = heapq.nlargest(5, ranked_resumes, key=lambda r: r['score'])
     
     report = {
         'summary': {
@@ -184,17 +224,64 @@ def create_summary_report(ranked_resumes, job_description: str):
             }
             for i, candidate in enumerate(top_candidates)
         ],
-        'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S")
+        'timestamp': time.strftime(REPORT_TIMESTAMP_FORMAT)
     }
     
     return report
 
 
+def label_enums(data: Any) -> Any:
+    """Replace enum members nested in dicts and lists with their display labels
+    
+    Enums such as the scorer's MatchStatus would otherwise serialize as bare
+    integers; members without a ``label`` fall back to their value.
+    """
+    if isinstance(data, dict):
+        return {key: label_enums(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [label_enums(value) for value in data]
+    if isinstance(data, Enum):
+        return getattr(data, 'label', data.value)
+    return data
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode numpy values and sets, which neither JSON encoder handles natively"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(data: Any, output_file: str):
+    """Write data as indented UTF-8 JSON, using orjson when it is installed"""
+    data = label_enums(data)
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(
+                data, default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            # Types orjson cannot encode fall through to the standard encoder
+            payload = None
+        
+        if payload is not None:
+            with open(output_file, 'wb') as f:
+                f.write(payload)
+            return
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+
+
 def save_summary_report(report, output_file: str = 'output/summary_report.json'):
     """Save summary report to file"""
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(report, output_file)
         
         logger.info(f"Summary report saved to {output_file}")
         
@@ -232,8 +319,7 @@ def save_results_to_json(results: Dict[str, Any], output_file: str = 'output/res
     """Save analysis results to JSON file"""
     try:
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        write_json(results, output_file)
         
         logger.info(f"Results saved to {output_file}")
         return True
@@ -243,6 +329,15 @@ def save_results_to_json(results: Dict[str, Any], output_file: str = 'output/res
         return False
 
 
+def _read_job_description(path: str):
+    """Read one job description, returning the exception instead of raising"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except Exception as e:
+        return e
+
+
 def load_job_descriptions(jobs_dir: str = 'data/job_descriptions') -> Dict[str, str]:
     """Load job descriptions from directory"""
     job_descriptions = {}
@@ -252,19 +347,22 @@ def load_job_descriptions(jobs_dir: str = 'data/job_descriptions') -> Dict[str,
             logger.warning(f"Job descriptions directory not found: {jobs_dir}")
             return job_descriptions
         
-        for filename in os.listdir(jobs_dir):
-            if filename.endswith('.txt'):
-                file_path = os.path.join(jobs_dir, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        job_name = filename.replace('.txt', '')
-                        job_descriptions[job_name] = content
-                        logger.info(f"Loaded job description: {filename}")
-                except Exception as e:
-                    logger.error(f"Error loading {filename}: {e}")
+        with os.scandir(jobs_dir) as entries:
+            job_files = [entry for entry in entries if entry.name.endswith('.txt') and entry.is_file()]
+        
+        # Reading is I/O bound, so overlap the file reads on a small thread pool
+        with ThreadPoolExecutor(max_workers=JOB_LOADER_WORKERS) as executor:
+            contents = list(executor.map(_read_job_description, [entry.path for entry in job_files]))
+        
+        for entry, content in zip(job_files, contents):
+            if isinstance(content, Exception):
+                logger.error(f"Error loading {entry.name}: {content}")
+                continue
+            job_name = entry.name.replace('.txt', '')
+            job_descriptions[job_name] = content
+            logger.info("Loaded job description: %s", entry.name)
         
-        logger.info(f"Loaded {len(job_descriptions)} job descriptions")
+        logger.info("Loaded %d job descriptions", len(job_descriptions))
         return job_descriptions
         
     except Exception as e:
@@ -0,0 +1,79 @@
+"""
+Shared pytest fixtures for ApexHire tests
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Callable
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # Optional faster event loop; winloop provides it on Windows
+    try:
+        import winloop as uvloop
+    except ImportError:
+        uvloop = None
+
+# RAM-backed directory used for tmp_path files when available (Linux)
+RAMDISK_ROOT = "/dev/shm"
+
+TEST_RESUME_CONTENT = b"Software Engineer with 5 years experience in Python and JavaScript."
+
+
+def pytest_configure(config):
+    """Use a ramdisk for temporary directories"""
+    # Move pytest's temp root rather than fixing --basetemp, so every run still
+    # gets its own numbered pytest-N directory and old runs are pruned as usual;
+    # an explicit --basetemp or PYTEST_DEBUG_TEMPROOT wins, and xdist workers
+    # inherit the controller's environment
+    if config.option.basetemp or hasattr(config, "workerinput"):
+        return
+    if os.path.isdir(RAMDISK_ROOT) and os.access(RAMDISK_ROOT, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", RAMDISK_ROOT)
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Create event loops with uvloop for async tests marked uvloop, when installed"""
+    if uvloop is not None and item.get_closest_marker("uvloop"):
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def resume_bytes():
+    """Canned resume content shared by the whole test session"""
+    return TEST_RESUME_CONTENT
+
+
+@pytest.fixture(scope="session")
+def resume_path(tmp_path_factory, resume_bytes):
+    """Resume file written once per session, for tests that need a real path"""
+    path = tmp_path_factory.mktemp("resumes", numbered=False) / "test_resume.txt"
+    path.write_bytes(resume_bytes)
+    return path
+
+
+@pytest.fixture
+def make_resume(tmp_path) -> Callable[..., Path]:
+    """Factory writing resume files into the test's tmp_path"""
+    def make(content: str = TEST_RESUME_CONTENT.decode("utf-8"), name: str = "resume.txt") -> Path:
+        path = tmp_path / name
+        path.write_bytes(content.encode("utf-8"))
+        return path
+    return make
+
+
+@pytest.fixture(scope="session")
+def screener():
+    """ResumeScreener shared across tests so its NLP models load once"""
+    from src.main_pipeline import ResumeScreener
+    return ResumeScreener()
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """ResumeParser shared across tests; it keeps no per-file state between calls"""
+    from src.parser import ResumeParser
+    return ResumeParser()
@@ -2,20 +2,42 @@
 API Tests for ApexHire FastAPI Application
 """
 
+import asyncio
+import contextlib
+import functools
+import json
 import pytest
-import tempfile
-import os
-from pathlib import Path
+import httpx
+from io import BytesIO
 from fastapi.testclient import TestClient
-import sys
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent.parent / "src"))
 
+# src is put on the import path by pytest.ini (pythonpath = src)
 from api.main import app
 
+# Async tests here run on uvloop when it is installed (see conftest.py)
+pytestmark = pytest.mark.uvloop
+
 client = TestClient(app)
 
+@functools.lru_cache(maxsize=None)
+def _build_form(content: bytes, filename: str, fields: tuple) -> tuple:
+    """Encode a single-file multipart form once, returning (body, content_type)"""
+    request = httpx.Request(
+        "POST", "http://test",
+        files={"file": (filename, content, "text/plain")},
+        data=dict(fields)
+    )
+    return request.read(), request.headers["content-type"]
+
+def post_form(url: str, content: bytes, filename: str, fields: dict):
+    """POST a prebuilt multipart form, reusing the encoded body across calls"""
+    body, content_type = _build_form(content, filename, tuple(fields.items()))
+    return client.post(url, content=body, headers={"content-type": content_type})
+
+def async_client():
+    """Create an AsyncClient that dispatches requests straight to the app"""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
 class TestAPIEndpoints:
     """Test cases for API endpoints"""
     
@@ -74,81 +96,93 @@ class TestAPIEndpoints:
 class TestResumeAnalysis:
     """Test resume analysis endpoints"""
     
-    def create_test_resume(self, content="Software Engineer with 5 years experience in Python and JavaScript."):
-        """Create a temporary test resume file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            return f.name
-    
-    def test_analyze_resume_success(self):
+    def test_analyze_resume_success(self, resume_path):
         """Test successful resume analysis"""
-        # Create test resume
-        resume_file = self.create_test_resume()
-        
-        try:
-            # Read file content first
-            with open(resume_file, 'rb') as f:
-                file_content = f.read()
-            
-            # Create file-like object for testing
-            from io import BytesIO
-            file_obj = BytesIO(file_content)
-            file_obj.name = "test_resume.txt"
-            
+        # Stream the upload from the file handle rather than a preloaded buffer
+        with open(resume_path, "rb") as fh:
             response = client.post(
                 "/analyze/resume",
-                files={"file": ("test_resume.txt", file_obj, "text/plain")},
+                files={"file": ("test_resume.txt", fh, "text/plain")},
                 data={
                     "job_title": "Software Engineer",
                     "job_description": "We need a Python developer with experience in web development.",
                     "requirements": "Python,JavaScript,React"
                 }
             )
-            
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "overall_score" in data
-            assert "breakdown" in data
-            assert "skills_found" in data
-            assert "recommendations" in data
-            assert "processing_time" in data
-            assert "status" in data
-            assert data["status"] == "success"
-            
-        finally:
-            # Cleanup
-            if os.path.exists(resume_file):
-                os.unlink(resume_file)
+        
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert "overall_score" in data
+        assert "breakdown" in data
+        assert "skills_found" in data
+        assert "recommendations" in data
+        assert "processing_time" in data
+        assert "status" in data
+        assert data["status"] == "success"
+        
+        # Match statuses are serialized as display labels, not enum values
+        labels = {"✅ Yes", "⚠️ Partial", "❌ No"}
+        assert data["breakdown"]["experience"]["status"] in labels
+        for check in data["breakdown"]["specific_requirements"].values():
+            assert check["status"] in labels
+    
+    def test_analyze_resume_cached_result(self, monkeypatch):
+        """Test that repeated identical analyses are served from the cache"""
+        import api.main
+        
+        form = {
+            "job_title": "Backend Engineer",
+            "job_description": "We need a Python developer for API work.",
+            "requirements": "Python,FastAPI"
+        }
+        content = b"Backend Engineer with 4 years experience in Python and FastAPI."
+        
+        first = post_form("/analyze/resume", content, "cached_resume.txt", form)
+        assert first.status_code == 200
+        
+        # A cache hit must not run the pipeline again
+        def fail_analysis(*args, **kwargs):
+            raise AssertionError("analysis should have been served from the cache")
+        monkeypatch.setattr(api.main.screener, "analyze_single_resume", fail_analysis)
+        
+        second = post_form("/analyze/resume", content, "cached_resume.txt", form)
+        assert second.status_code == 200
+        assert second.json()["overall_score"] == first.json()["overall_score"]
+    
+    def test_analysis_cache_hands_out_copies(self):
+        """Test that callers mutating a cached analysis do not change the cache"""
+        import api.main
+        
+        key = ("copy-test",)
+        result = {"overall_score": 80, "breakdown": {"skills": {"matched": ["python"]}}}
+        api.main._cache_analysis(key, result)
+        result["breakdown"]["skills"]["matched"].append("stored")
+        
+        hit = api.main._cached_analysis(key)
+        assert hit == {"overall_score": 80, "breakdown": {"skills": {"matched": ["python"]}}}
+        
+        hit["breakdown"]["skills"]["matched"].append("returned")
+        hit["overall_score"] = 0
+        assert api.main._cached_analysis(key) == {"overall_score": 80, "breakdown": {"skills": {"matched": ["python"]}}}
+        assert api.main._cached_analysis(("missing",)) is None
     
     def test_analyze_resume_invalid_file_type(self):
         """Test resume analysis with invalid file type"""
-        # Create test file with invalid extension
-        with tempfile.NamedTemporaryFile(suffix='.invalid', delete=False) as f:
-            f.write(b"test content")
-            invalid_file = f.name
+        response = client.post(
+            "/analyze/resume",
+            files={"file": ("test.invalid", BytesIO(b"test content"), "application/octet-stream")},
+            data={
+                "job_title": "Software Engineer",
+                "job_description": "Test job description",
+                "requirements": "Python"
+            }
+        )
         
-        try:
-            with open(invalid_file, 'rb') as f:
-                response = client.post(
-                    "/analyze/resume",
-                    files={"file": ("test.invalid", f, "application/octet-stream")},
-                    data={
-                        "job_title": "Software Engineer",
-                        "job_description": "Test job description",
-                        "requirements": "Python"
-                    }
-                )
-            
-            assert response.status_code == 400
-            data = response.json()
-            assert "detail" in data
-            assert "Unsupported file type" in data["detail"]
-            
-        finally:
-            # Cleanup
-            if os.path.exists(invalid_file):
-                os.unlink(invalid_file)
+        assert response.status_code == 400
+        data = response.json()
+        assert "detail" in data
+        assert "Unsupported file type" in data["detail"]
     
     def test_analyze_resume_missing_file(self):
         """Test resume analysis with missing file"""
@@ -163,141 +197,115 @@ class TestResumeAnalysis:
         
         assert response.status_code == 422  # Validation error
     
-    def test_analyze_resume_missing_job_title(self):
+    def test_analyze_resume_missing_job_title(self, resume_bytes):
         """Test resume analysis with missing job title"""
-        resume_file = self.create_test_resume()
+        response = client.post(
+            "/analyze/resume",
+            files={"file": ("test_resume.txt", BytesIO(resume_bytes), "text/plain")},
+            data={
+                "job_description": "Test job description",
+                "requirements": "Python"
+            }
+        )
         
-        try:
-            with open(resume_file, 'rb') as f:
-                response = client.post(
-                    "/analyze/resume",
-                    files={"file": ("test_resume.txt", f, "text/plain")},
-                    data={
-                        "job_description": "Test job description",
-                        "requirements": "Python"
-                    }
-                )
-            
-            assert response.status_code == 422  # Validation error
-            
-        finally:
-            # Cleanup
-            if os.path.exists(resume_file):
-                os.unlink(resume_file)
+        assert response.status_code == 422  # Validation error
 
 class TestBatchAnalysis:
     """Test batch analysis endpoints"""
     
     def create_test_resumes(self, count=2):
-        """Create multiple test resume files"""
-        files = []
-        for i in range(count):
-            content = f"Software Engineer {i} with experience in Python and JavaScript."
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                f.write(content)
-                files.append(f.name)
-        return files
+        """Create multiple in-memory test resume contents"""
+        return [
+            f"Software Engineer {i} with experience in Python and JavaScript.".encode("utf-8")
+            for i in range(count)
+        ]
     
-    def test_batch_analysis_success(self):
+    @pytest.mark.asyncio
+    async def test_batch_analysis_success(self, make_resume):
         """Test successful batch analysis"""
-        # Create test resumes
-        resume_files = self.create_test_resumes(2)
+        resume_files = [
+            make_resume(content.decode("utf-8"), name=f"resume_{i}.txt")
+            for i, content in enumerate(self.create_test_resumes(2))
+        ]
         
-        try:
-            files = []
-            for i, file_path in enumerate(resume_files):
-                # Read file content first
-                with open(file_path, 'rb') as f:
-                    file_content = f.read()
-                
-                # Create file-like object for testing
-                from io import BytesIO
-                file_obj = BytesIO(file_content)
-                file_obj.name = f"resume_{i}.txt"
-                
-                files.append(("files", (f"resume_{i}.txt", file_obj, "text/plain")))
-            
-            response = client.post(
-                "/analyze/batch",
-                files=files,
-                data={
-                    "job_title": "Senior Developer",
-                    "job_description": "Senior role requiring Python and leadership skills.",
-                    "requirements": "Python,Leadership,5+ years"
-                }
-            )
+        # Stream each upload from its file handle rather than a preloaded buffer
+        with contextlib.ExitStack() as stack:
+            files = [
+                ("files", (resume_file.name, stack.enter_context(open(resume_file, "rb")), "text/plain"))
+                for resume_file in resume_files
+            ]
             
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "job_title" in data
-            assert "total_files" in data
-            assert "results" in data
-            assert "summary" in data
-            assert data["total_files"] == 2
-            assert len(data["results"]) == 2
-            
-            # Check summary
-            summary = data["summary"]
-            assert "successful" in summary
-            assert "failed" in summary
-            assert "average_score" in summary
-            
-        finally:
-            # Cleanup
-            for file_path in resume_files:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
+            async with async_client() as ac:
+                response = await ac.post(
+                    "/analyze/batch",
+                    files=files,
+                    data={
+                        "job_title": "Senior Developer",
+                        "job_description": "Senior role requiring Python and leadership skills.",
+                        "requirements": "Python,Leadership,5+ years"
+                    }
+                )
+        
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert "job_title" in data
+        assert "total_files" in data
+        assert "results" in data
+        assert "summary" in data
+        assert data["total_files"] == 2
+        assert len(data["results"]) == 2
+        
+        # Check summary
+        summary = data["summary"]
+        assert "successful" in summary
+        assert "failed" in summary
+        assert "average_score" in summary
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_resume_analyses(self):
+        """Test several single-resume analyses dispatched concurrently"""
+        async with async_client() as ac:
+            responses = await asyncio.gather(*[
+                ac.post(
+                    "/analyze/resume",
+                    files={"file": (f"concurrent_{i}.txt", BytesIO(content), "text/plain")},
+                    data={
+                        "job_title": "Senior Developer",
+                        "job_description": "Senior role requiring Python and leadership skills.",
+                        "requirements": "Python,Leadership"
+                    }
+                )
+                for i, content in enumerate(self.create_test_resumes(3))
+            ])
+        
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        assert all(response.json()["status"] == "success" for response in responses)
     
     def test_batch_analysis_mixed_file_types(self):
         """Test batch analysis with mixed valid and invalid file types"""
-        # Create one valid and one invalid file
-        valid_file = self.create_test_resumes(1)[0]
+        valid_content = self.create_test_resumes(1)[0]
         
-        with tempfile.NamedTemporaryFile(suffix='.invalid', delete=False) as f:
-            f.write(b"invalid content")
-            invalid_file = f.name
+        files = [
+            ("files", ("valid.txt", BytesIO(valid_content), "text/plain")),
+            ("files", ("invalid.invalid", BytesIO(b"invalid content"), "application/octet-stream")),
+        ]
         
-        try:
-            files = []
-            
-            # Read file content first, then create BytesIO objects (like the working test)
-            with open(valid_file, 'rb') as f:
-                valid_content = f.read()
-            with open(invalid_file, 'rb') as f:
-                invalid_content = f.read()
-            
-            # Create file-like objects for testing
-            from io import BytesIO
-            valid_file_obj = BytesIO(valid_content)
-            valid_file_obj.name = "valid.txt"
-            invalid_file_obj = BytesIO(invalid_content)
-            invalid_file_obj.name = "invalid.invalid"
-            
-            files.append(("files", ("valid.txt", valid_file_obj, "text/plain")))
-            files.append(("files", ("invalid.invalid", invalid_file_obj, "application/octet-stream")))
-            
-            response = client.post(
-                "/analyze/batch",
-                files=files,
-                data={
-                    "job_title": "Developer",
-                    "job_description": "Test job description",
-                    "requirements": "Python"
-                }
-            )
-            
-            # Should fail due to invalid file type
-            assert response.status_code == 400
-            data = response.json()
-            assert "detail" in data
-            assert "Unsupported file type" in data["detail"]
-            
-        finally:
-            # Cleanup
-            for file_path in [valid_file, invalid_file]:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
+        response = client.post(
+            "/analyze/batch",
+            files=files,
+            data={
+                "job_title": "Developer",
+                "job_description": "Test job description",
+                "requirements": "Python"
+            }
+        )
+        
+        # Should fail due to invalid file type
+        assert response.status_code == 400
+        data = response.json()
+        assert "detail" in data
+        assert "Unsupported file type" in data["detail"]
 
 class TestErrorHandling:
     """Test error handling in API endpoints"""
@@ -317,49 +325,30 @@ class TestErrorHandling:
         """Test configuration endpoint error handling"""
         response = client.get("/config")
         assert response.status_code in [200, 500]  # Should handle errors gracefully
+    
+    def test_json_response_falls_back_for_unencodable_content(self):
+        """Test that content orjson rejects is rendered by the standard encoder"""
+        from api.main import FastJSONResponse
+        
+        # Integers beyond 64 bits raise TypeError in orjson but not in json
+        response = FastJSONResponse({"count": 2 ** 70, "name": "résumé"})
+        assert json.loads(response.body) == {"count": 2 ** 70, "name": "résumé"}
 
 class TestPerformanceMonitoring:
     """Test performance monitoring integration"""
     
-    def create_test_resume(self, content="Software Engineer with 5 years experience in Python and JavaScript."):
-        """Create a temporary test resume file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            return f.name
-    
-    def test_performance_metrics_included(self):
+    def test_performance_metrics_included(self, resume_bytes):
         """Test that performance metrics are included in responses"""
-        resume_file = self.create_test_resume()
+        response = post_form("/analyze/resume", resume_bytes, "test_resume.txt", {
+            "job_title": "Software Engineer",
+            "job_description": "Test job description",
+            "requirements": "Python"
+        })
         
-        try:
-            # Read file content first
-            with open(resume_file, 'rb') as f:
-                file_content = f.read()
-            
-            # Create file-like object for testing
-            from io import BytesIO
-            file_obj = BytesIO(file_content)
-            file_obj.name = "test_resume.txt"
-            
-            response = client.post(
-                "/analyze/resume",
-                files={"file": ("test_resume.txt", file_obj, "text/plain")},
-                data={
-                    "job_title": "Software Engineer",
-                    "job_description": "Test job description",
-                    "requirements": "Python"
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                assert "processing_time" in data
-                assert isinstance(data["processing_time"], (int, float))
-                
-        finally:
-            # Cleanup
-            if os.path.exists(resume_file):
-                os.unlink(resume_file)
+        if response.status_code == 200:
+            data = response.json()
+            assert "processing_time" in data
+            assert isinstance(data["processing_time"], (int, float))
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
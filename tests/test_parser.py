@@ -2,46 +2,59 @@
 Test cases for the parser module
 """
 
-import pytest
-import tempfile
 import os
-from src.parser import ResumeParser
+import pytest
 
 class TestResumeParser:
     """Test cases for ResumeParser class"""
     
-    def test_supported_formats(self):
+    def test_supported_formats(self, parser):
         """Test that supported formats are correctly identified"""
-        parser = ResumeParser()
         assert '.pdf' in parser.supported_formats
         assert '.docx' in parser.supported_formats
         assert '.txt' in parser.supported_formats
     
-    def test_parse_resume_with_invalid_file(self):
+    def test_parse_resume_with_invalid_file(self, parser, make_resume):
         """Test parsing with invalid file"""
-        parser = ResumeParser()
-        with tempfile.NamedTemporaryFile(suffix='.invalid', delete=False) as f:
-            f.write(b"test content")
-            f.flush()
-            
-            result = parser.parse_resume(f.name)
-            assert result is None
-            
-        os.unlink(f.name)
+        invalid_file = make_resume("test content", name="resume.invalid")
+        
+        result = parser.parse_resume(str(invalid_file))
+        assert result is None
+    
+    def test_extract_text_from_bytes(self, parser):
+        """Test text extraction from in-memory TXT content"""
+        test_content = "This is a test resume content."
+        
+        assert parser.extract_text_from_bytes(test_content.encode('utf-8')) == test_content
+        assert parser.extract_text_from_bytes("Résumé\r\nline".encode('cp1252'), encoding='cp1252') == "Résumé\nline"
+        assert parser.extract_text_from_bytes(b"   ") is None
     
-    def test_extract_text_from_txt(self):
+    def test_extract_text_from_txt(self, parser, make_resume):
         """Test text extraction from TXT files"""
-        parser = ResumeParser()
         test_content = "This is a test resume content."
         
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as f:
-            f.write(test_content.encode('utf-8'))
-            f.flush()
-            
-            result = parser.extract_text_from_txt(f.name)
-            assert result == test_content
-            
-        os.unlink(f.name)
+        txt_file = make_resume(test_content)
+        
+        result = parser.extract_text_from_txt(str(txt_file))
+        assert result == test_content
+    
+    def test_extract_text_from_txt_rereads_modified_file(self, parser, make_resume):
+        """Test that cached TXT contents are refreshed when the file changes"""
+        txt_file = make_resume("First version of the resume.")
+        assert parser.extract_text_from_txt(str(txt_file)) == "First version of the resume."
+        
+        make_resume("Second, longer version of the resume.")
+        assert parser.extract_text_from_txt(str(txt_file)) == "Second, longer version of the resume."
+    
+    def test_extract_text_from_txt_rewrite_with_same_stat(self, parser, make_resume):
+        """Test that a rewrite keeping size and mtime is not served stale text"""
+        txt_file = make_resume("Resume version A.")
+        st = os.stat(txt_file)
+        assert parser.extract_text_from_txt(str(txt_file)) == "Resume version A."
+        
+        make_resume("Resume version B.")
+        os.utime(txt_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert parser.extract_text_from_txt(str(txt_file)) == "Resume version B."
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -3,12 +3,10 @@ Performance tests for ApexHire
 """
 
 import pytest
-import time
-import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from src.performance_monitor import PerformanceMonitor, check_system_resources
-from src.main_pipeline import ResumeScreener
 
 class TestPerformance:
     """Performance test cases"""
@@ -29,15 +27,13 @@ class TestPerformance:
     
     def test_performance_metric_recording(self):
         """Test recording performance metrics"""
-        monitor = PerformanceMonitor()
+        # Fake clock: the simulated work takes 0.1s without sleeping
+        monitor = PerformanceMonitor(clock=iter([0.0, 0.1]).__next__)
         monitor.start_monitoring()
         
-        # Simulate some work
-        time.sleep(0.1)
-        
         monitor.record_metric(
             operation="test_operation",
-            duration=0.1,
+            duration=monitor.elapsed(),
             additional_data={"test": True}
         )
         
@@ -64,38 +60,59 @@ class TestPerformance:
         assert 'op1' in summary['unique_operations']
         assert 'op2' in summary['unique_operations']
     
-    def test_metrics_saving(self):
+    def test_performance_summary_beyond_initial_capacity(self):
+        """Test that the duration buffer grows past its initial capacity"""
+        monitor = PerformanceMonitor()
+        monitor.get_system_metrics = lambda: {}
+        
+        count = len(monitor._durations) + 1
+        for i in range(count):
+            monitor.record_metric("op", float(i))
+        
+        summary = monitor.get_summary()
+        assert summary['total_operations'] == count
+        assert summary['max_duration'] == float(count - 1)
+        assert summary['operation_counts'] == {'op': count}
+    
+    def test_metrics_built_from_buffers(self):
+        """Test that metric records match what was recorded, and last limits them"""
+        monitor = PerformanceMonitor()
+        monitor.get_system_metrics = lambda: {}
+        
+        for i in range(5):
+            monitor.record_metric(f"op{i}", i * 0.5, memory_usage={'current_mb': i},
+                                  additional_data={'index': i})
+        
+        metrics = monitor.metrics
+        assert [m['operation'] for m in metrics] == ["op0", "op1", "op2", "op3", "op4"]
+        assert [m['duration_seconds'] for m in metrics] == [0.0, 0.5, 1.0, 1.5, 2.0]
+        assert metrics[3]['memory_usage'] == {'current_mb': 3}
+        assert metrics[3]['additional_data'] == {'index': 3}
+        assert monitor.get_metrics(last=2) == metrics[-2:]
+        assert monitor.get_metrics(last=10) == metrics
+        assert monitor.get_metrics(last=0) == []
+    
+    def test_metrics_saving(self, tmp_path):
         """Test saving metrics to file"""
-        monitor = PerformanceMonitor(output_dir="test_logs")
+        monitor = PerformanceMonitor(output_dir=str(tmp_path / "test_logs"))
         monitor.record_metric("test_op", 1.0)
         
         filename = monitor.save_metrics("test_metrics.json")
         assert filename is not None
         assert os.path.exists(filename)
-        
-        # Cleanup
-        os.remove(filename)
-        os.rmdir("test_logs")
     
     @pytest.mark.slow
-    def test_resume_processing_performance(self):
+    def test_resume_processing_performance(self, screener, resume_path):
         """Test resume processing performance"""
-        screener = ResumeScreener()
         monitor = PerformanceMonitor()
         
-        # Create a test resume file
-        test_content = "Software Engineer with 5 years experience in Python, JavaScript, and React."
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(test_content)
-            test_file = f.name
-        
         try:
             monitor.start_monitoring()
             
             # Process the resume
-            result = screener.analyze_resume(test_file)
+            result = screener.analyze_resume(str(resume_path))
             
-            duration = time.time() - monitor.start_time
+            duration = monitor.elapsed()
             monitor.record_metric("resume_analysis", duration)
             
             # Performance assertions
@@ -109,7 +126,6 @@ class TestPerformance:
             
         finally:
             monitor.stop_monitoring()
-            os.unlink(test_file)
     
     def test_memory_usage_tracking(self):
         """Test memory usage tracking"""
@@ -117,7 +133,7 @@ class TestPerformance:
         monitor.start_monitoring()
         
         # Simulate memory usage
-        large_list = [i for i in range(100000)]
+        large_buf = bytearray(4 * 100_000)
         
         memory_usage = monitor.get_memory_usage()
         monitor.stop_monitoring()
@@ -125,29 +141,24 @@ class TestPerformance:
         # Memory usage should be tracked
         assert 'current_mb' in memory_usage or memory_usage == {}
     
-    def test_concurrent_processing(self):
+    def test_concurrent_processing(self, screener, make_resume):
         """Test concurrent processing performance"""
-        screener = ResumeScreener()
         monitor = PerformanceMonitor()
         
         # Create multiple test files
-        test_files = []
-        for i in range(3):
-            content = f"Software Engineer {i} with experience in Python and JavaScript."
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-                f.write(content)
-                test_files.append(f.name)
+        test_files = [
+            str(make_resume(f"Software Engineer {i} with experience in Python and JavaScript.", name=f"resume_{i}.txt"))
+            for i in range(3)
+        ]
         
         try:
             monitor.start_monitoring()
             
-            # Process files sequentially
-            results = []
-            for file in test_files:
-                result = screener.analyze_resume(file)
-                results.append(result)
+            # Process files concurrently
+            with ThreadPoolExecutor(max_workers=len(test_files)) as executor:
+                results = list(executor.map(screener.analyze_resume, test_files))
             
-            duration = time.time() - monitor.start_time
+            duration = monitor.elapsed()
             monitor.record_metric("batch_processing", duration)
             
             # Performance assertions
@@ -157,8 +168,6 @@ class TestPerformance:
             
         finally:
             monitor.stop_monitoring()
-            for file in test_files:
-                os.unlink(file)
     
     def test_error_handling_performance(self):
         """Test performance monitoring with errors"""
@@ -169,7 +178,7 @@ class TestPerformance:
             # Simulate an error
             raise ValueError("Test error")
         except ValueError:
-            duration = time.time() - monitor.start_time
+            duration = monitor.elapsed()
             monitor.record_metric(
                 "error_operation",
                 duration,
@@ -0,0 +1,225 @@
+"""
+Test cases for the scorer module
+"""
+
+import numpy as np
+import pytest
+from src.scorer import ResumeScorer
+
+
+class FakeEmbedder:
+    """Deterministic stand-in for a SentenceTransformer that records encode calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=None, normalize_embeddings=False, show_progress_bar=False):
+        self.calls.append(list(texts))
+        vectors = []
+        for text in texts:
+            vector = np.zeros(16)
+            for i, char in enumerate(text):
+                vector[(ord(char) + i) % 16] += 1.0
+            norm = np.linalg.norm(vector)
+            vectors.append(vector / norm if norm else vector)
+        return np.array(vectors)
+
+
+@pytest.fixture
+def embedder():
+    """Fake embedding model"""
+    return FakeEmbedder()
+
+
+@pytest.fixture
+def scorer(embedder):
+    """ResumeScorer whose embedding model is the fake embedder"""
+    scorer = ResumeScorer()
+    scorer._get_embedder = lambda: embedder
+    return scorer
+
+
+JOB_DESCRIPTION = "Senior iOS engineer with Swift, SwiftUI and XCTest experience"
+
+RESUMES = [
+    {'filename': 'a.txt', 'text': "iOS developer, Swift and SwiftUI, XCTest"},
+    {'filename': 'b.txt', 'text': "Backend engineer working with Java and Kafka"},
+    {'filename': 'c.txt', 'text': "Mobile engineer: Swift, UIKit, Fastlane"},
+]
+
+
+class TestSemanticSimilarity:
+    """Test cases for batched semantic similarity and ranking"""
+
+    def test_job_description_encoded_once_per_batch(self, scorer, embedder):
+        """Test that one batch encodes the job once and all resumes together"""
+        scorer.calculate_semantic_similarity([r['text'] for r in RESUMES], JOB_DESCRIPTION)
+
+        assert sum(call.count(JOB_DESCRIPTION) for call in embedder.calls) == 1
+        assert [r['text'] for r in RESUMES] in embedder.calls
+        assert len(embedder.calls) == 2
+
+    def test_similarities_match_per_resume_loop(self, scorer):
+        """Test that batched similarities equal encoding each resume on its own"""
+        reference = FakeEmbedder()
+        job_embedding = reference.encode([JOB_DESCRIPTION])[0]
+        expected = [
+            max(float(reference.encode([r['text']])[0] @ job_embedding), 0.0)
+            for r in RESUMES
+        ]
+
+        similarities = scorer.calculate_semantic_similarity([r['text'] for r in RESUMES], JOB_DESCRIPTION)
+
+        assert similarities == pytest.approx(expected)
+
+    def test_rank_resumes_matches_per_resume_loop(self, scorer):
+        """Test that ranking order and scores match scoring resumes one at a time"""
+        expected = sorted(
+            (
+                (r['filename'], scorer.calculate_semantic_similarity([r['text']], JOB_DESCRIPTION)[0])
+                for r in RESUMES
+            ),
+            key=lambda item: item[1], reverse=True
+        )
+
+        ranked = scorer.rank_resumes(RESUMES, JOB_DESCRIPTION)
+
+        assert [entry['filename'] for entry in ranked] == [name for name, _ in expected]
+        assert [entry['score'] for entry in ranked] == pytest.approx([score for _, score in expected])
+
+    def test_empty_batch(self, scorer, embedder):
+        """Test that an empty batch returns nothing without encoding"""
+        assert scorer.calculate_semantic_similarity([], JOB_DESCRIPTION) == []
+        assert scorer.rank_resumes([], JOB_DESCRIPTION) == []
+        assert embedder.calls == []
+
+
+JOB_REQUIREMENTS = {
+    'required_skills': ['Swift', 'SwiftUI', 'XCTest'],
+    'preferred_skills': ['Fastlane'],
+    'experience_years': 3
+}
+
+
+def make_analysis(technical_skills, soft_skills=('agile',)):
+    """Build a resume analysis as produced by ResumeScreener.analyze_resume"""
+    return {
+        'filename': 'resume.txt',
+        'text': "iOS developer using Swift and SwiftUI in an agile team",
+        'skills': {'technical_skills': list(technical_skills), 'soft_skills': list(soft_skills)},
+        'experience': [{'start_date': '2019', 'end_date': '2023'}],
+        'education': []
+    }
+
+
+class TestATSScoreCache:
+    """Test cases for the ATS score result cache"""
+
+    def test_mutating_result_does_not_affect_cache(self):
+        """Test that a caller mutating a result leaves later results intact"""
+        scorer = ResumeScorer(use_semantic_similarity=False)
+        analysis = make_analysis(['swift', 'swiftui'])
+
+        first = scorer.calculate_ats_score(analysis, JOB_REQUIREMENTS)
+        expected_gaps = list(first['gaps'])
+        first['breakdown']['skills']['required_matches'] = -1
+        first['gaps'].append("mutated")
+        first['highlights'].clear()
+
+        second = scorer.calculate_ats_score(analysis, JOB_REQUIREMENTS)
+        assert second['breakdown']['skills']['required_matches'] == 2
+        assert second['gaps'] == expected_gaps
+
+        second['gaps'].append("mutated again")
+        assert scorer.calculate_ats_score(analysis, JOB_REQUIREMENTS)['gaps'] == expected_gaps
+
+    def test_same_text_with_different_skills_is_rescored(self):
+        """Test that the cache key covers extracted skills, not only the text"""
+        scorer = ResumeScorer(use_semantic_similarity=False)
+
+        fewer = scorer.calculate_ats_score(make_analysis(['swift']), JOB_REQUIREMENTS)
+        more = scorer.calculate_ats_score(make_analysis(['swift', 'swiftui', 'xctest']), JOB_REQUIREMENTS)
+
+        assert fewer['breakdown']['skills']['required_matches'] == 1
+        assert more['breakdown']['skills']['required_matches'] == 3
+        assert more['overall_score'] > fewer['overall_score']
+
+
+
+ANALYSES = [
+    make_analysis(['swift', 'swiftui', 'xctest', 'fastlane']),
+    make_analysis(['swift']),
+    make_analysis([], soft_skills=()),
+    make_analysis(['swiftui', 'xctest'], soft_skills=('leadership', 'communication')),
+]
+
+
+def make_ranked_resumes(count):
+    """Resume analyses for ranking, with duplicate texts so that scores tie"""
+    resumes = []
+    for i in range(count):
+        analysis = make_analysis([['swift'], ['swift', 'swiftui'], []][i % 3])
+        analysis['filename'] = f"resume_{i}.txt"
+        analysis['text'] = RESUMES[i % len(RESUMES)]['text']
+        resumes.append(analysis)
+    return resumes
+
+
+class TestATSScorer:
+    """Test cases for job-specialized ATS scoring"""
+
+    @pytest.mark.parametrize("analysis", ANALYSES)
+    def test_make_scorer_matches_calculate_ats_score(self, analysis):
+        """Test that a specialized scorer returns the same analysis as a one-off score"""
+        score = ResumeScorer(use_semantic_similarity=False).make_scorer(JOB_REQUIREMENTS)
+        expected = ResumeScorer(use_semantic_similarity=False).calculate_ats_score(analysis, JOB_REQUIREMENTS)
+
+        assert score(analysis) == expected
+
+    def test_make_scorer_reused_across_resumes(self):
+        """Test that one scorer gives the same results for a whole batch as fresh scorers"""
+        score = ResumeScorer(use_semantic_similarity=False).make_scorer(JOB_REQUIREMENTS)
+
+        results = [score(analysis) for analysis in ANALYSES]
+
+        assert results == [
+            ResumeScorer(use_semantic_similarity=False).calculate_ats_score(analysis, JOB_REQUIREMENTS)
+            for analysis in ANALYSES
+        ]
+
+    def test_rank_resumes_parallel_matches_serial(self, scorer):
+        """Test that ranking on a thread pool gives the same result as ranking inline"""
+        resumes = make_ranked_resumes(12)
+
+        serial = scorer.rank_resumes(resumes, JOB_DESCRIPTION, JOB_REQUIREMENTS, max_workers=1)
+        parallel = scorer.rank_resumes(resumes, JOB_DESCRIPTION, JOB_REQUIREMENTS, max_workers=4)
+
+        assert parallel == serial
+
+
+class TestRankResumesTopK:
+    """Test cases for returning only the best ranked resumes"""
+
+    @pytest.mark.parametrize("top_k", [0, 1, 3, 5, 9, 20])
+    def test_top_k_is_prefix_of_full_ranking(self, scorer, top_k):
+        """Test that top_k returns the head of the full ranking, tied scores in input order"""
+        resumes = make_ranked_resumes(9)
+
+        full = scorer.rank_resumes(resumes, JOB_DESCRIPTION, JOB_REQUIREMENTS)
+        top = scorer.rank_resumes(resumes, JOB_DESCRIPTION, JOB_REQUIREMENTS, top_k=top_k)
+
+        assert len({entry['score'] for entry in full}) < len(full)
+        assert top == full[:top_k]
+
+    def test_top_k_without_job_requirements(self, scorer):
+        """Test top_k when ranking on semantic similarity alone"""
+        resumes = make_ranked_resumes(6)
+
+        full = scorer.rank_resumes(resumes, JOB_DESCRIPTION)
+
+        assert scorer.rank_resumes(resumes, JOB_DESCRIPTION, top_k=2) == full[:2]
+        assert scorer.rank_resumes(resumes, JOB_DESCRIPTION, top_k=10) == full
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,71 @@
+"""
+Test cases for the skills extractor module
+"""
+
+import pytest
+from src.skills_extractor import AdvancedSkillsExtractor
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """Skills extractor shared by the module so spaCy loads once"""
+    return AdvancedSkillsExtractor()
+
+
+IOS_RESUME = "Senior iOS developer: Swift 5, SwiftUI, XCTest and Fastlane. Led an agile team."
+BACKEND_RESUME = "Built REST APIs in Python with FastAPI and PostgreSQL; strong communication skills."
+
+
+class TestExtractSkillsBatch:
+    """Test cases for batched skills extraction"""
+
+    @pytest.mark.parametrize("texts", [
+        [IOS_RESUME, BACKEND_RESUME],
+        ["", IOS_RESUME, ""],
+        ["   ", "\n\t", BACKEND_RESUME],
+        [IOS_RESUME, IOS_RESUME, BACKEND_RESUME, IOS_RESUME],
+        ["Python"],
+        [],
+    ], ids=["distinct", "empty", "whitespace", "duplicates", "single", "no-texts"])
+    @pytest.mark.parametrize("batch_size", [1, 64])
+    def test_batch_matches_per_text_extraction(self, extractor, texts, batch_size):
+        """Test that batched results equal extract_skills on each text, in order"""
+        expected = [extractor.extract_skills(text) for text in texts]
+
+        assert extractor.extract_skills_batch(texts, batch_size=batch_size) == expected
+
+    def test_empty_text_result(self, extractor):
+        """Test that empty texts give empty skill lists"""
+        assert extractor.extract_skills_batch([""]) == [
+            {'technical_skills': [], 'soft_skills': [], 'all_skills': []}
+        ]
+
+
+class TestDirectMatching:
+    """Test cases for longest-variation direct skill matching"""
+
+    @pytest.mark.parametrize("text", [
+        "built with xcode cloudkit sync",
+        "jenkins cicd pipelines",
+        "swift uikit",
+        "swiftui and swift ui with xcode cloud",
+    ])
+    def test_direct_matching_agrees_with_automaton(self, extractor, text):
+        """Test that a longer variation cut mid-word does not hide the shorter skill"""
+        direct = {match.skill for match in extractor._extract_with_direct_matching(text)}
+        automaton = {match.skill for match in extractor._extract_with_automaton(text)}
+
+        assert direct
+        assert direct == automaton
+
+    @pytest.mark.parametrize("text, expected", [
+        ("built with xcode cloudkit sync", {"xcode"}),
+        ("swift uikit", {"swift", "uikit"}),
+    ])
+    def test_direct_matching_regressions(self, extractor, text, expected):
+        """Test skills found next to a longer variation's prefix"""
+        assert {match.skill for match in extractor._extract_with_direct_matching(text)} == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
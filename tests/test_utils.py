@@ -0,0 +1,164 @@
+"""
+Test cases for the utils module
+"""
+
+import json
+import numpy as np
+import pytest
+import src.utils as utils
+from src.utils import build_keyword_automaton, iter_keyword_matches, label_enums, write_json
+from src.scorer import ResumeScorer, MatchStatus
+
+
+def matched_keywords(keywords, text, longest=False):
+    """Return the keywords matched in text, in scan order"""
+    automaton = build_keyword_automaton({keyword: keyword for keyword in keywords})
+    return [keyword for _, _, keyword, _ in iter_keyword_matches(automaton, text, longest=longest)]
+
+
+class TestKeywordMatching:
+    """Test cases for whole-word keyword matching with the Aho-Corasick automaton"""
+
+    @pytest.mark.parametrize("text", ["bios update", "kiosk mode", "iosx", "the bios"])
+    def test_keyword_inside_longer_word_not_matched(self, text):
+        """Test that 'ios' does not match inside another word"""
+        assert matched_keywords(["ios"], text) == []
+
+    @pytest.mark.parametrize("text, expected", [
+        ("c++, c# and go", ["c++", "c#"]),
+        ("(c++/c#)", ["c++", "c#"]),
+        ("skills: c#.", ["c#"]),
+        ("c++11 and c#9", []),
+    ])
+    def test_symbol_keywords_at_punctuation_boundaries(self, text, expected):
+        """Test keywords ending in symbols next to punctuation and word characters"""
+        assert matched_keywords(["c++", "c#"], text) == expected
+
+    def test_matches_at_start_and_end_of_text(self):
+        """Test that keywords touching the text edges are matched"""
+        assert matched_keywords(["ios", "swift"], "ios and swift") == ["ios", "swift"]
+        assert matched_keywords(["ios"], "ios") == ["ios"]
+
+    def test_match_positions(self):
+        """Test that reported spans cover the keyword in the text"""
+        automaton = build_keyword_automaton({"swift": "Swift"})
+        text = "i use swift daily"
+        matches = list(iter_keyword_matches(automaton, text))
+        assert matches == [(6, 11, "swift", "Swift")]
+        assert text[6:11] == "swift"
+
+    def test_overlapping_keywords(self):
+        """Test that all overlapping keywords match unless longest is requested"""
+        keywords = ["swift", "swift ui", "ui"]
+        text = "built with swift ui daily"
+
+        assert sorted(matched_keywords(keywords, text)) == ["swift", "swift ui", "ui"]
+        assert matched_keywords(keywords, text, longest=True) == ["swift ui"]
+
+    def test_longest_match_at_text_edges(self):
+        """Test longest-match scanning when keywords start and end the text"""
+        keywords = ["app store", "app store connect", "store"]
+        assert matched_keywords(keywords, "app store connect", longest=True) == ["app store connect"]
+        assert matched_keywords(keywords, "app store", longest=True) == ["app store"]
+
+    @pytest.mark.parametrize("text, expected", [
+        ("built with xcode cloudkit sync", ["xcode"]),
+        ("jenkins cicd pipelines", ["jenkins"]),
+        ("swift uikit", ["swift"]),
+        ("swift uikit and swift ui", ["swift", "swift ui"]),
+    ])
+    def test_longest_falls_back_when_longer_keyword_is_cut_mid_word(self, text, expected):
+        """Test that a longer keyword failing the word boundary does not hide a shorter one"""
+        keywords = ["xcode", "xcode cloud", "jenkins", "jenkins ci", "swift", "swift ui"]
+        assert matched_keywords(keywords, text, longest=True) == expected
+
+    def test_longest_keeps_keyword_starting_inside_rejected_match(self):
+        """Test that keywords starting inside a rejected longer match are still found"""
+        keywords = ["azure", "azure iot", "iot"]
+        assert matched_keywords(keywords, "azure iots and iot", longest=True) == ["azure", "iot"]
+        assert matched_keywords(["ab cd", "cd ef"], "ab cd efg", longest=True) == ["ab cd"]
+
+
+class TestSpecificRequirementsText:
+    """Test cases for requirement keywords found directly in resume text"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("shipped apps via app store connect and testflight", {"app_store"}),
+        ("wrote bios firmware", set()),
+        ("ios, swift.", {"ios_development", "swift_experience"}),
+        ("ci/cd with github actions", {"cicd"}),
+        ("oauth 2.0 login", {"authentication"}),
+    ])
+    def test_categories_found_in_text(self, text, expected):
+        """Test that categories are found only for whole-word keywords"""
+        scorer = ResumeScorer(use_semantic_similarity=False)
+        assert scorer._check_specific_requirements_text(text) == expected
+
+
+class TestWriteJson:
+    """Test cases for JSON output of analysis results"""
+
+    def test_match_status_written_as_label(self, tmp_path):
+        """Test that breakdown statuses are written as display labels"""
+        breakdown = {
+            'experience': {'status': MatchStatus.PARTIAL, 'required_years': 3},
+            'specific_requirements': {'testing': {'status': MatchStatus.YES}},
+            'history': [MatchStatus.NO]
+        }
+        output_file = tmp_path / "results.json"
+
+        write_json({'breakdown': breakdown}, str(output_file))
+
+        written = json.loads(output_file.read_text(encoding='utf-8'))
+        assert written['breakdown'] == {
+            'experience': {'status': "⚠️ Partial", 'required_years': 3},
+            'specific_requirements': {'testing': {'status': "✅ Yes"}},
+            'history': ["❌ No"]
+        }
+        assert breakdown['experience']['status'] is MatchStatus.PARTIAL
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "stdlib"])
+    def test_numpy_values_and_sets(self, tmp_path, monkeypatch, use_orjson):
+        """Test that numpy scalars, arrays and sets are written with either encoder"""
+        if use_orjson and utils.orjson is None:
+            pytest.skip("orjson is not installed")
+        if not use_orjson:
+            monkeypatch.setattr(utils, "orjson", None)
+        data = {
+            'score': np.float64(0.75),
+            'count': np.int64(3),
+            'vector': np.array([1.0, 2.0]),
+            'skills': {"swift", "kotlin"},
+            'name': "résumé"
+        }
+        output_file = tmp_path / "results.json"
+
+        write_json(data, str(output_file))
+
+        assert json.loads(output_file.read_text(encoding='utf-8')) == {
+            'score': 0.75, 'count': 3, 'vector': [1.0, 2.0],
+            'skills': ["kotlin", "swift"], 'name': "résumé"
+        }
+
+    def test_falls_back_when_orjson_rejects_data(self, tmp_path):
+        """Test the standard encoder fallback for data orjson raises TypeError on"""
+        if utils.orjson is None:
+            pytest.skip("orjson is not installed")
+        # Integers beyond 64 bits are valid JSON but unsupported by orjson
+        data = {'big': 2 ** 70, 'skills': {"swift"}, 'score': np.float32(0.5)}
+        output_file = tmp_path / "results.json"
+
+        write_json(data, str(output_file))
+
+        assert json.loads(output_file.read_text(encoding='utf-8')) == {
+            'big': 2 ** 70, 'skills': ["swift"], 'score': 0.5
+        }
+
+    def test_label_enums_leaves_other_values(self):
+        """Test that non-enum values pass through unchanged"""
+        data = {'score': 0.5, 'name': "swift", 'count': 2, 'none': None}
+        assert label_enums(data) == data
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])